@@ -0,0 +1,113 @@
+import functools
+from typing import List
+
+import pandas as pd
+
+from accounts import AccountRegistry
+from accounts import account_registry
+from amounts import to_nullable_int
+from config import ReportTypes
+
+# 표준계정코드를 사용하지 않는 계정과목의 account_id
+NON_STANDARD_ACCOUNT_ID = "-표준계정코드 미사용-"
+
+
+class AccountClassifier:
+    """
+    AccountRegistry 의 account_id -> 계정, 계정과목명 -> 계정 dict 를 테이블로 변환한 뒤,
+    재무제표의 모든 행을 한 번에 분류하고 계정별로 합산
+    """
+
+    def __init__(
+        self, report_type: ReportTypes, registry: AccountRegistry = account_registry
+    ):
+        self.report_type = report_type
+        self.account_names: List[str] = [
+            account.value for account in registry.get_accounts(report_type)
+        ]
+
+        # (키, 계정) 쌍으로 저장
+        self.id_map = pd.DataFrame(
+            [
+                (account_id, account.value)
+                for account_id, accounts in registry.by_id[report_type].items()
+                for account in accounts
+            ],
+            columns=["account_id", "account"],
+        )
+        self.name_map = pd.DataFrame(
+            [
+                (name_key, account.value)
+                for name_key, accounts in registry.by_name[report_type].items()
+                for account in accounts
+            ],
+            columns=["name_key", "account"],
+        )
+
+    @staticmethod
+    def get_values(report_df: pd.DataFrame) -> pd.Series:
+        """
+        값이 없는 경우를 제외하면 기본적으로 누적값(thstrm_add_amount) 사용
+        분기별로 값을 처리하는 과정은 ReportCalculator 에서 따로 진행
+        :return: 행별 금액 (Int64). 값이 없는 경우 NA
+        """
+        values = to_nullable_int(report_df.thstrm_amount)
+        if "thstrm_add_amount" in report_df:
+            values = to_nullable_int(report_df.thstrm_add_amount).fillna(values)
+
+        return values
+
+    def classify(self, report_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        :return: (row, account) 쌍. row 는 report_df 의 위치
+        """
+        keys = pd.DataFrame(
+            {
+                "row": range(len(report_df)),
+                "account_id": report_df.account_id.to_numpy(),
+                "name_key": report_df.account_nm.str.replace(
+                    " ", "", regex=False
+                ).to_numpy(),
+            }
+        )
+
+        by_id = keys.merge(self.id_map, on="account_id")
+        # 표준계정코드 미사용하는 경우 계정과목명과 직접 대조
+        by_name = keys[keys.account_id == NON_STANDARD_ACCOUNT_ID].merge(
+            self.name_map, on="name_key"
+        )
+
+        return pd.concat([by_id, by_name])[["row", "account"]].drop_duplicates()
+
+    def get_amounts(self, report_df: pd.DataFrame) -> pd.Series:
+        """
+        :return: 계정명(enum value) -> 합계. 해당하는 행이 없는 계정은 0
+        """
+        # 표준계정코드 미사용의 경우 계정과목명으로 비교하므로 같은 행이 중복될 수 있음
+        report_df = report_df.drop_duplicates()
+
+        matched = self.classify(report_df)
+        matched["amount"] = self.get_values(report_df).to_numpy()[
+            matched.row.to_numpy()
+        ]
+
+        amounts = matched.groupby("account", sort=False)["amount"].sum()
+        return (
+            amounts.reindex(self.account_names, fill_value=0).fillna(0).astype("int64")
+        )
+
+    def get_df(self, report_df: pd.DataFrame) -> pd.DataFrame:
+        amounts = self.get_amounts(report_df)
+        return pd.DataFrame(
+            {
+                "sj_div": self.report_type.name,
+                "sj_nm": self.report_type.value,
+                "account_nm": amounts.index,
+                "amount": amounts.to_numpy(),
+            }
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_account_classifier(report_type: ReportTypes) -> AccountClassifier:
+    return AccountClassifier(report_type)
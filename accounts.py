@@ -1,5 +1,8 @@
 from enum import Enum
+from typing import Dict
+from typing import List
 
+from config import AccountDetail
 from config import ReportTypes
 
 
@@ -81,495 +84,525 @@ class CashFlowAccounts(Enum):
     DIVIDENDS_PAID = "배당금 지급"
 
 
+# 계정별 규칙. names: 표준계정코드 미사용시 비교하는 계정과목명, ids: 표준계정코드
+# 새로운 계정과목명, 표준계정코드는 아래 테이블에 추가
+BALANCE_SHEET_RULES: Dict[BalanceSheetAccounts, AccountDetail] = {
+    BalanceSheetAccounts.CURRENT_ASSETS: {
+        "names": ["유동자산"],
+        "ids": ["ifrs-full_CurrentAssets"],
+    },
+    BalanceSheetAccounts.CASH_AND_CASH_EQUIVALENTS: {
+        "names": ["현금및현금성자산"],
+        "ids": [
+            "ifrs-full_CashAndCashEquivalents",
+            "ifrs-full_Cash",
+            "ifrs-full_CashEquivalents",
+        ],
+    },
+    BalanceSheetAccounts.TRADE_AND_OTHER_CURRENT_RECEIVABLES: {
+        "names": [
+            "매출채권",
+            "매출채권및기타채권",
+            "매출채권 및 기타수취채권",
+            "매출채권 및 기타채권",
+        ],
+        "ids": [
+            "ifrs-full_TradeAndOtherCurrentReceivables",
+            "dart_ShortTermTradeReceivable",
+            "dart_AllowanceForDoubtfulAcccountShortTermTradeReceivable",
+            "ifrs-full_TradeReceivables",
+        ],
+    },
+    BalanceSheetAccounts.OTHER_CURRENT_ASSETS: {
+        "names": ["기타유동자산"],
+        "ids": ["ifrs-full_OtherCurrentAssets", "dart_OtherCurrentAssets"],
+    },
+    BalanceSheetAccounts.INVENTORIES: {
+        "names": ["재고자산"],
+        "ids": [
+            "ifrs-full_Inventories",
+            "dart_RawMaterialsGross",
+            "ifrs-full_InventoriesTotal",
+        ],
+    },
+    BalanceSheetAccounts.NON_CURRENT_ASSETS: {
+        "names": ["비유동자산"],
+        "ids": ["ifrs-full_NoncurrentAssets"],
+    },
+    BalanceSheetAccounts.TRADE_AND_OTHER_NON_CURRENT_RECEIVABLES: {
+        "names": [
+            "매출채권(비유동)",
+            "장기매출채권",
+            "장기매출채권및기타채권",
+            "장기매출채권 및 기타채권",
+            "비유동매출채권 및 기타채권",
+            "장기성매출채권",
+            "매출채권및상각후원가측정금융자산(비유동)",
+        ],
+        "ids": [
+            "dart_LongTermTradeReceivablesGross",
+            "dart_LongTermTradeAndOtherNonCurrentReceivablesGross",
+            "dart_AllowanceForDoubtfulAcccountLongTermTradeReceivablesGross",
+            "ifrs-full_NoncurrentTradeReceivables",
+            "ifrs-full_NoncurrentReceivables",
+        ],
+    },
+    BalanceSheetAccounts.OTHER_NON_CURRENT_ASSETS: {
+        "names": ["기타비유동자산"],
+        "ids": ["ifrs-full_OtherNoncurrentAssets", "dart_OtherNonCurrentAssets"],
+    },
+    BalanceSheetAccounts.PROPERTY_PLANT_AND_EQUIPMENT: {
+        "names": ["유형자산"],
+        "ids": [
+            "ifrs-full_PropertyPlantAndEquipment",
+            "dart_OtherPropertyPlantAndEquipmentGross",
+        ],
+    },
+    BalanceSheetAccounts.INTANGIBLE_ASSETS: {
+        "names": ["무형자산", "무형자산 및 영업권", "기타무형자산"],
+        "ids": [
+            "ifrs-full_IntangibleAssetsOtherThanGoodwill",
+            "dart_OtherIntangibleAssetsGross",
+            "dart_GoodwillGross",
+            "ifrs-full_IntangibleAssetsAndGoodwill",
+            "ifrs-full_OtherNoncurrentFinancialAssets",
+        ],
+    },
+    BalanceSheetAccounts.ASSETS: {
+        "names": ["자산총계"],
+        "ids": ["ifrs-full_Assets"],
+    },
+    BalanceSheetAccounts.CURRENT_LIABILITIES: {
+        "names": ["유동부채"],
+        "ids": ["ifrs-full_CurrentLiabilities"],
+    },
+    BalanceSheetAccounts.TRADE_AND_OTHER_CURRENT_PAYABLES: {
+        "names": ["매입채무", "유동매입채무", "매입채무및기타채무"],
+        "ids": [
+            "ifrs-full_TradeAndOtherCurrentPayables",
+            "dart_ShortTermTradePayables",
+            "ifrs-full_TradeAndOtherPayablesToTradeSuppliers",
+            "ifrs-full_TradeAndOtherCurrentPayablesToTradeSuppliers",
+        ],
+    },
+    BalanceSheetAccounts.SHORT_TERM_BORROWINGS: {
+        "names": [
+            "유동성장기차입금",
+            "단기차입금",
+            "단기차입금 및 유동성장기부채",
+            "단기차입금및유동성장기차입금",
+            "외화단기차입금",
+            "단기 차입금",
+            "차입금",
+            "유동 장기 차입금",
+            "유동성 단기차입금",
+            "차입금및사채",
+            "유동성사채및장기차입금",
+            "유동차입금및유동사채",
+            "유동 차입금 및 사채",
+            "유동성차입금",
+            "유동차입금",
+        ],
+        "ids": [
+            "ifrs-full_ShorttermBorrowings",
+            "ifrs-full_Borrowings",
+            "ifrs-full_OtherCurrentFinancialLiabilities",
+        ],
+    },
+    BalanceSheetAccounts.CURRENT_CONVERTIBLE_BONDS: {
+        "names": ["전환사채", "전환사채(유동)", "유동전환사채"],
+        "ids": ["dart_CurrentPortionOfConvertibleBonds", "dart_ConvertibleBonds"],
+    },
+    BalanceSheetAccounts.SHORT_TERM_INCOME_RECEIVED_IN_ADVANCE: {
+        "names": ["선수수익(유동)"],
+        "ids": ["dart_ShortTermIncomeReceivedInAdvance"],
+    },
+    BalanceSheetAccounts.SHORT_TERM_ADVANCES_CUSTOMERS: {
+        "names": ["선수금(유동)"],
+        "ids": ["dart_ShortTermAdvancesCustomers", "ifrs-full_Advances"],
+    },
+    BalanceSheetAccounts.NON_CURRENT_LIABILITIES: {
+        "names": ["비유동부채"],
+        "ids": ["ifrs-full_NoncurrentLiabilities"],
+    },
+    BalanceSheetAccounts.TRADE_AND_OTHER_NON_CURRENT_PAYABLES: {
+        "names": [
+            "비유동매입채무 및 기타채무",
+            "장기매입채무 및 기타채무",
+            "매입채무 및 기타금융부채(비유동)",
+            "장기매입채무및기타채무",
+        ],
+        "ids": [
+            "dart_LongTermTradeAndOtherNonCurrentPayables",
+            "dart_LongTermTradePayablesGross",
+        ],
+    },
+    BalanceSheetAccounts.LONG_TERM_BORROWINGS: {
+        "names": [
+            "장기차입금 및 사채",
+            "장기차입금",
+            "비유동차입금및비유동사채",
+            "비유동차입금",
+        ],
+        "ids": ["dart_LongTermBorrowingsGross", "ifrs-full_LongtermBorrowings"],
+    },
+    BalanceSheetAccounts.NON_CURRENT_CONVERTIBLE_BONDS: {
+        "names": ["비유동전환사채", "전환사채(장기)"],
+        "ids": [],
+    },
+    BalanceSheetAccounts.LONG_TERM_INCOME_RECEIVED_IN_ADVANCE: {
+        "names": [],
+        "ids": ["dart_LongTermIncomeReceivedInAdvance"],
+    },
+    BalanceSheetAccounts.LONG_TERM_ADVANCES_CUSTOMERS: {
+        "names": ["장기선수금"],
+        "ids": ["dart_LongTermAdvancesCustomers"],
+    },
+    BalanceSheetAccounts.LIABILITIES: {
+        "names": ["부채총계"],
+        "ids": ["ifrs-full_Liabilities"],
+    },
+    BalanceSheetAccounts.ISSUED_CAPITAL: {
+        "names": ["자본금"],
+        "ids": ["ifrs-full_IssuedCapital"],
+    },
+    BalanceSheetAccounts.RETAINED_EARNINGS: {
+        "names": ["이익잉여금", "이익잉여금(결손금)"],
+        "ids": ["ifrs-full_RetainedEarnings"],
+    },
+    BalanceSheetAccounts.EQUITY: {
+        "names": ["자본총계"],
+        "ids": ["ifrs-full_Equity"],
+    },
+    BalanceSheetAccounts.EQUITY_AND_LIABILITIES: {
+        "names": ["자본과부채총계"],
+        "ids": ["ifrs-full_EquityAndLiabilities"],
+    },
+}
+
+INCOME_STATEMENT_RULES: Dict[IncomeStatementAccounts, AccountDetail] = {
+    IncomeStatementAccounts.REVENUE: {
+        "names": ["매출액"],
+        "ids": ["ifrs-full_Revenue"],
+    },
+    IncomeStatementAccounts.REVENUE_FROM_SALE_OF_GOODS_PRODUCT: {
+        "names": ["제품매출", "제품매출액"],
+        "ids": [
+            "dart_RevenueFromSaleOfGoodsProduct",
+            "ifrs-full_RevenueFromSaleOfGoods",
+        ],
+    },
+    IncomeStatementAccounts.REVENUE_FROM_SALE_OF_GOODS_MERCHANDISE: {
+        "names": ["상품매출", "상품매출액", "(1) 상품매출액"],
+        "ids": ["dart_RevenueFromSaleOfGoodsMerchandise"],
+    },
+    IncomeStatementAccounts.COST_OF_SALES: {
+        "names": ["매출원가"],
+        "ids": ["ifrs-full_CostOfSales"],
+    },
+    IncomeStatementAccounts.COST_OF_SALES_FROM_SALE_OF_GOODS_PRODUCT: {
+        "names": ["제품매출원가"],
+        "ids": ["dart_CostOfSalesFromSaleOfGoodsProduct"],
+    },
+    IncomeStatementAccounts.COST_OF_SALES_FROM_SALE_OF_GOODS_MERCHANDISE: {
+        "names": ["상품매출원가"],
+        "ids": ["ifrs-full_CostOfMerchandiseSold", "dart_CostOfSalesFromSaleOfGoods"],
+    },
+    IncomeStatementAccounts.GROSS_PROFIT: {
+        "names": ["매출총이익"],
+        "ids": ["ifrs-full_GrossProfit"],
+    },
+    IncomeStatementAccounts.SELLING_GENERAL_ADMINISTRATIVE_EXPENSES: {
+        "names": ["판매비와관리비", "판매비", "관리비", "판매관리비", "판매비용"],
+        "ids": [
+            "dart_TotalSellingGeneralAdministrativeExpenses",
+            "ifrs-full_GeneralAndAdministrativeExpense",
+            "ifrs-full_SellingGeneralAndAdministrativeExpense",
+            "ifrs-full_SellingExpense",
+        ],
+    },
+    IncomeStatementAccounts.OPERATING_INCOME_LOSS: {
+        "names": ["영업이익"],
+        "ids": [
+            "dart_OperatingIncomeLoss",
+            "ifrs-full_ProfitLossFromOperatingActivities",
+        ],
+    },
+    IncomeStatementAccounts.PROFIT_LOSS: {
+        "names": ["당기순이익", "당기순이익(손실)"],
+        "ids": ["ifrs-full_ProfitLoss"],
+    },
+}
+
+CASH_FLOW_RULES: Dict[CashFlowAccounts, AccountDetail] = {
+    CashFlowAccounts.OPERATING_ACTIVITIES: {
+        "names": ["영업활동현금흐름"],
+        "ids": [
+            "ifrs-full_CashFlowsFromUsedInOperatingActivities",
+            "ifrs-full_CashFlowsFromUsedInOperations",
+        ],
+    },
+    CashFlowAccounts.PROFIT_LOSS: {
+        "names": ["당기순이익"],
+        "ids": ["ifrs-full_ProfitLoss"],
+    },
+    # CashFlowAccounts.ADJUSTMENTS_FOR_ASSETS_LIABILITIES_OF_OPERATING_ACTIVITIES: {
+    #     "names": [
+    #         "영업으로부터 창출된 현금흐름",
+    #         "영업에서 창출된 현금",
+    #         "영업으로부터창출된현금",
+    #         "영업에서 창출한 현금흐름",
+    #         "영업활동에서창출된현금흐름",
+    #     ],
+    #     "ids": [
+    #         "dart_NetCashflowsFromUsedInOperations",
+    #         "dart_AdjustmentsForAssetsLiabilitiesOfOperatingActivities",
+    #         "ifrs-full_OtherInflowsOutflowsOfCashClassifiedAsOperatingActivities",
+    #         "ifrs-full_AdjustmentsForReconcileProfitLoss",
+    #     ],
+    # },
+    CashFlowAccounts.INTEREST_PAID: {
+        "names": ["이자지급", "이자지급액", "이자지급(영업)"],
+        "ids": [
+            "ifrs-full_InterestPaidClassifiedAsOperatingActivities",
+            "ifrs-full_InterestPaidClassifiedAsOperatingActivities",
+        ],
+    },
+    CashFlowAccounts.INTEREST_RECEIVED: {
+        "names": ["이자수취", "이자수취(영업)", "이자수취액"],
+        "ids": ["ifrs-full_InterestReceivedClassifiedAsOperatingActivities"],
+    },
+    CashFlowAccounts.INVESTING_ACTIVITIES: {
+        "names": ["투자활동현그흐름"],
+        "ids": ["ifrs-full_CashFlowsFromUsedInInvestingActivities"],
+    },
+    CashFlowAccounts.PURCHASE_OF_FINANCIAL_INSTRUMENTS: {
+        "names": [
+            "단기금융상품의 증가",
+            "단기금융상품의 취득",
+            "장단기금융상품의 취득",
+            "금융상품의 증가",
+            "장기금융상품의 납입",
+            "장기금융상품의증가",
+            "장단기금융상품의 증가",
+            "장ㆍ단기금융상품의 증가",
+            "장,단기금융상품의 증가",
+        ],
+        "ids": [
+            "dart_PurchaseOfShortTermFinancialInstruments",
+            "dart_PurchaseOfLongTermFinancialInstruments",
+            "dart_PurchaseOfFinancialInstruments",
+            "ifrs-full_PurchaseOfFinancialInstrumentsClassifiedAsInvestingActivities",
+            "ifrs-full_PurchaseOfOtherLongtermAssetsClassifiedAsInvestingActivities",
+        ],
+    },
+    CashFlowAccounts.SALES_OF_FINANCIAL_INSTRUMENTS: {
+        "names": [
+            "단기금융상품의 감소",
+            "장기금융상품의처분",
+            "장기금융상품의 감소",
+            "장단기금융상품의 처분",
+            "단기금융상품의 처분",
+            "장기금융상품의 해지",
+            "단기금융상품의 해지",
+            "장기금융상품의감소",
+            "단기금융상품의감소",
+            "장단기금융상품의 감소",
+            "장ㆍ단기금융상품의 감소",
+            "장,단기금융상품의 감소",
+        ],
+        "ids": [
+            "dart_ProceedsFromSalesOfShortTermFinancialInstruments",
+            "dart_ProceedsFromSalesOfLongTermFinancialInstruments",
+            "dart_ProceedsFromSalesOfFinancialInstruments",
+            "dart_ProceedsFromSalesOfOtherFinancialAssets",
+            "dart_ProceedsFromSalesOfOtherCurrentFinancialAssets",
+        ],
+    },
+    CashFlowAccounts.PURCHASE_OF_PROPERTY_PLANT_AND_EQUIPMENT: {
+        "names": [
+            "유형자산의 취득",
+            "유형자산의취득",
+            "유형자산의 증가",
+            "유형자산 취득",
+        ],
+        "ids": [
+            "ifrs-full_PurchaseOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities",
+            "dart_PurchaseOfOtherPropertyPlantAndEquipment",
+        ],
+    },
+    CashFlowAccounts.SALES_OF_PROPERTY_PLANT_AND_EQUIPMENT: {
+        "names": [
+            "유형자산의 처분",
+            "유형자산의 감소",
+            "유형자산 처분",
+            "유형자산 감소",
+        ],
+        "ids": [
+            "ifrs-full_ProceedsFromSalesOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities"
+        ],
+    },
+    CashFlowAccounts.FINANCING_ACTIVITIES: {
+        "names": ["재무활동현금흐름"],
+        "ids": ["ifrs-full_CashFlowsFromUsedInFinancingActivities"],
+    },
+    CashFlowAccounts.PROCEEDS_FROM_BORROWINGS: {
+        "names": [
+            "차입금의 증가",
+            "단기차입금의 차입",
+            "장기차입금의 차입",
+            "장기차입금의 증가",
+            "단기차입금의 증가",
+            "차입금의 순차입",
+            "단기차입금의차입",
+            "장기차입금의차입",
+            "단기차입금의 순증감",
+            "장기차입금의 증감",
+            "차입금의 차입",
+            "단기차입금의 순차입",
+            "장기차입금의 순차입",
+            "차입금및사채의 증가",
+            "장기차입금 및 사채의 차입",
+            "사채 및 장기차입금 차입",
+            "단기차입금의증가",
+            "유동성장기차입금의 차입",
+            "유동성장기차입금의 증가",
+            "장기차입금 차입",
+            "단기차입금 증가",
+            "차입금 차입",
+            "유동성장기부채및단기차입금의 차입",
+            "장기차입금의증가",
+            "단기차입금 및 사채의 차입",
+            "유동성차입금의 증가",
+            "차입금 및 사채의 차입",
+        ],
+        "ids": [
+            "dart_ProceedsFromShortTermBorrowings",
+            "dart_ProceedsFromLongTermBorrowings",
+            "ifrs-full_ProceedsFromBorrowingsClassifiedAsFinancingActivities",
+            "ifrs-full_ProceedsFromNoncurrentBorrowings",
+            "ifrs-full_ProceedsFromCurrentBorrowings",
+        ],
+    },
+    CashFlowAccounts.REPAYMENTS_OF_BORROWINGS: {
+        "names": [
+            "유동성장기차입금의 상환",
+            "장기차입금의 상환",
+            "단기차입금의 상환",
+            "유동성장기차입금의 감소",
+            "장기차입금의 감소",
+            "단기차입금의 감소",
+            "유동장기차입금의 상환",
+            "차입금의 상환",
+            "차입금의 감소",
+            "차입금의 순상환",
+            "유동성장기차입금의상환",
+            "유동성 장기차입금의 상환",
+            "(유동성)장기차입금 상환",
+            "유동성장기차입금 상환",
+            "장기차입금의상환",
+            "단기차입금의상환",
+            "유동차입금의 상환",
+            "장기차입금 상환",
+            "차입금및사채의 상환",
+            "유동성차입금의 상환",
+            "장기차입금 및 사채의 상환",
+            "사채 및 장기차입금 상환",
+            "단기차입금의 순상환",
+            "차입금 상환",
+            "유동성단기차입금의 상환",
+            "단기차입금의감소",
+            "단기차입금 감소",
+            "유동성장기부채및단기차입금의 상환",
+            "유동성 장기차입금의 감소",
+            "유동성장차입금의 감소",
+            "단기차입금 및 사채의 상환",
+            "유동성차입금(기타)의 상환",
+            "유동성차입금의 감소",
+            "유동성자기차입금 상환",
+            "장기차입금 감소",
+            "유동성장기차입금의감소",
+        ],
+        "ids": [
+            "dart_RepaymentsOfLongTermBorrowings",
+            "dart_RepaymentsOfShortTermBorrowings",
+            "ifrs-full_RepaymentsOfBorrowingsClassifiedAsFinancingActivities",
+            "ifrs-full_RepaymentsOfCurrentBorrowings",
+            "ifrs-full_RepaymentsOfNoncurrentBorrowings",
+        ],
+    },
+    CashFlowAccounts.DIVIDENDS_PAID: {
+        "names": ["배당금지급", "배당금의 지급"],
+        "ids": ["ifrs-full_DividendsPaidClassifiedAsFinancingActivities"],
+    },
+}
+
+
+ACCOUNT_RULES: Dict[ReportTypes, Dict[Enum, AccountDetail]] = {
+    ReportTypes.BS: BALANCE_SHEET_RULES,
+    ReportTypes.CIS: INCOME_STATEMENT_RULES,
+    ReportTypes.CF: CASH_FLOW_RULES,
+}
+
+
+def normalize_account_name(name: str) -> str:
+    return name.replace(" ", "")
+
+
+class AccountRegistry:
+    """
+    계정과목 규칙을 한 번만 읽어서 재무제표 종류별 조회용 dict 로 변환
+    하나의 표준계정코드, 계정과목명이 여러 계정에 포함될 수 있으므로 계정 목록으로 저장
+    """
+
+    def __init__(self, rules: Dict[ReportTypes, Dict[Enum, AccountDetail]]):
+        self.rules = rules
+        self.by_id: Dict[ReportTypes, Dict[str, List[Enum]]] = {}
+        self.by_name: Dict[ReportTypes, Dict[str, List[Enum]]] = {}
+
+        for report_type, account_rules in rules.items():
+            by_id = self.by_id.setdefault(report_type, {})
+            by_name = self.by_name.setdefault(report_type, {})
+
+            for account, account_detail in account_rules.items():
+                for account_id in account_detail["ids"]:
+                    self.add(by_id, account_id, account)
+                for name in account_detail["names"]:
+                    self.add(by_name, normalize_account_name(name), account)
+
+    @staticmethod
+    def add(lookup: Dict[str, List[Enum]], key: str, account: Enum):
+        accounts = lookup.setdefault(key, [])
+        if account not in accounts:
+            accounts.append(account)
+
+    def get_accounts(self, report_type: ReportTypes) -> List[Enum]:
+        return list(self.rules[report_type])
+
+    def get_detail(self, report_type: ReportTypes, account: Enum) -> AccountDetail:
+        return self.rules.get(report_type, {}).get(account)
+
+    def find_by_id(self, report_type: ReportTypes, account_id: str) -> List[Enum]:
+        return self.by_id[report_type].get(account_id, [])
+
+    def find_by_name(self, report_type: ReportTypes, name: str) -> List[Enum]:
+        return self.by_name[report_type].get(normalize_account_name(name), [])
+
+
+account_registry = AccountRegistry(ACCOUNT_RULES)
+
+
 def get_account_detail(report_type, account):
-    if report_type == ReportTypes.BS:
-        return get_bs_account_detail(account)
-    if report_type == ReportTypes.CIS:
-        return get_cis_account_detail(account)
-    if report_type == ReportTypes.CF:
-        return get_cf_account_detail(account)
+    return account_registry.get_detail(report_type, account)
 
 
 def get_bs_account_detail(account: BalanceSheetAccounts):
-    if account == BalanceSheetAccounts.ASSETS:
-        return {"names": ["자산총계"], "ids": ["ifrs-full_Assets"]}
-
-    if account == BalanceSheetAccounts.CURRENT_ASSETS:
-        return {"names": ["유동자산"], "ids": ["ifrs-full_CurrentAssets"]}
-    if account == BalanceSheetAccounts.CASH_AND_CASH_EQUIVALENTS:
-        return {
-            "names": ["현금및현금성자산"],
-            "ids": [
-                "ifrs-full_CashAndCashEquivalents",
-                "ifrs-full_Cash",
-                "ifrs-full_CashEquivalents",
-            ],
-        }
-    if account == BalanceSheetAccounts.TRADE_AND_OTHER_CURRENT_RECEIVABLES:
-        return {
-            "names": [
-                "매출채권",
-                "매출채권및기타채권",
-                "매출채권 및 기타수취채권",
-                "매출채권 및 기타채권",
-            ],
-            "ids": [
-                "ifrs-full_TradeAndOtherCurrentReceivables",
-                "dart_ShortTermTradeReceivable",
-                "dart_AllowanceForDoubtfulAcccountShortTermTradeReceivable",
-                "ifrs-full_TradeReceivables",
-            ],
-        }
-    if account == BalanceSheetAccounts.OTHER_CURRENT_ASSETS:
-        return {
-            "names": ["기타유동자산"],
-            "ids": ["ifrs-full_OtherCurrentAssets", "dart_OtherCurrentAssets"],
-        }
-    if account == BalanceSheetAccounts.INVENTORIES:
-        return {
-            "names": ["재고자산"],
-            "ids": [
-                "ifrs-full_Inventories",
-                "dart_RawMaterialsGross",
-                "ifrs-full_InventoriesTotal",
-            ],
-        }
-
-    if account == BalanceSheetAccounts.NON_CURRENT_ASSETS:
-        return {"names": ["비유동자산"], "ids": ["ifrs-full_NoncurrentAssets"]}
-    if account == BalanceSheetAccounts.TRADE_AND_OTHER_NON_CURRENT_RECEIVABLES:
-        return {
-            "names": [
-                "매출채권(비유동)",
-                "장기매출채권",
-                "장기매출채권및기타채권",
-                "장기매출채권 및 기타채권",
-                "비유동매출채권 및 기타채권",
-                "장기성매출채권",
-                "매출채권및상각후원가측정금융자산(비유동)",
-            ],
-            "ids": [
-                "dart_LongTermTradeReceivablesGross",
-                "dart_LongTermTradeAndOtherNonCurrentReceivablesGross",
-                "dart_AllowanceForDoubtfulAcccountLongTermTradeReceivablesGross",
-                "ifrs-full_NoncurrentTradeReceivables",
-                "ifrs-full_NoncurrentReceivables",
-            ],
-        }
-    if account == BalanceSheetAccounts.OTHER_NON_CURRENT_ASSETS:
-        return {
-            "names": ["기타비유동자산"],
-            "ids": ["ifrs-full_OtherNoncurrentAssets", "dart_OtherNonCurrentAssets"],
-        }
-    if account == BalanceSheetAccounts.PROPERTY_PLANT_AND_EQUIPMENT:
-        return {
-            "names": ["유형자산"],
-            "ids": [
-                "ifrs-full_PropertyPlantAndEquipment",
-                "dart_OtherPropertyPlantAndEquipmentGross",
-            ],
-        }
-    if account == BalanceSheetAccounts.INTANGIBLE_ASSETS:
-        return {
-            "names": ["무형자산", "무형자산 및 영업권", "기타무형자산"],
-            "ids": [
-                "ifrs-full_IntangibleAssetsOtherThanGoodwill",
-                "dart_OtherIntangibleAssetsGross",
-                "dart_GoodwillGross",
-                "ifrs-full_IntangibleAssetsAndGoodwill",
-                "ifrs-full_OtherNoncurrentFinancialAssets",
-            ],
-        }
-
-    if account == BalanceSheetAccounts.LIABILITIES:
-        return {"names": ["부채총계"], "ids": ["ifrs-full_Liabilities"]}
-
-    if account == BalanceSheetAccounts.CURRENT_LIABILITIES:
-        return {"names": ["유동부채"], "ids": ["ifrs-full_CurrentLiabilities"]}
-    if account == BalanceSheetAccounts.TRADE_AND_OTHER_CURRENT_PAYABLES:
-        return {
-            "names": ["매입채무", "유동매입채무", "매입채무및기타채무"],
-            "ids": [
-                "ifrs-full_TradeAndOtherCurrentPayables",
-                "dart_ShortTermTradePayables",
-                "ifrs-full_TradeAndOtherPayablesToTradeSuppliers",
-                "ifrs-full_TradeAndOtherCurrentPayablesToTradeSuppliers",
-            ],
-        }
-
-    if account == BalanceSheetAccounts.SHORT_TERM_BORROWINGS:
-        return {
-            "names": [
-                "유동성장기차입금",
-                "단기차입금",
-                "단기차입금 및 유동성장기부채",
-                "단기차입금및유동성장기차입금",
-                "외화단기차입금",
-                "단기 차입금",
-                "차입금",
-                "유동 장기 차입금",
-                "유동성 단기차입금",
-                "차입금및사채",
-                "유동성사채및장기차입금",
-                "유동차입금및유동사채",
-                "유동 차입금 및 사채",
-                "유동성차입금",
-                "유동차입금",
-            ],
-            "ids": [
-                "ifrs-full_ShorttermBorrowings",
-                "ifrs-full_Borrowings",
-                "ifrs-full_OtherCurrentFinancialLiabilities",
-            ],
-        }
-    if account == BalanceSheetAccounts.CURRENT_CONVERTIBLE_BONDS:
-        return {
-            "names": ["전환사채", "전환사채(유동)", "유동전환사채"],
-            "ids": ["dart_CurrentPortionOfConvertibleBonds", "dart_ConvertibleBonds"],
-        }
-    if account == BalanceSheetAccounts.SHORT_TERM_INCOME_RECEIVED_IN_ADVANCE:
-        return {
-            "names": ["선수수익(유동)"],
-            "ids": ["dart_ShortTermIncomeReceivedInAdvance"],
-        }
-    if account == BalanceSheetAccounts.SHORT_TERM_ADVANCES_CUSTOMERS:
-        return {
-            "names": ["선수금(유동)"],
-            "ids": ["dart_ShortTermAdvancesCustomers", "ifrs-full_Advances"],
-        }
-
-    if account == BalanceSheetAccounts.NON_CURRENT_LIABILITIES:
-        return {"names": ["비유동부채"], "ids": ["ifrs-full_NoncurrentLiabilities"]}
-    if account == BalanceSheetAccounts.TRADE_AND_OTHER_NON_CURRENT_PAYABLES:
-        return {
-            "names": [
-                "비유동매입채무 및 기타채무",
-                "장기매입채무 및 기타채무",
-                "매입채무 및 기타금융부채(비유동)",
-                "장기매입채무및기타채무",
-            ],
-            "ids": [
-                "dart_LongTermTradeAndOtherNonCurrentPayables",
-                "dart_LongTermTradePayablesGross",
-            ],
-        }
-    if account == BalanceSheetAccounts.LONG_TERM_BORROWINGS:
-        return {
-            "names": [
-                "장기차입금 및 사채",
-                "장기차입금",
-                "비유동차입금및비유동사채",
-                "비유동차입금",
-            ],
-            "ids": ["dart_LongTermBorrowingsGross", "ifrs-full_LongtermBorrowings"],
-        }
-    if account == BalanceSheetAccounts.NON_CURRENT_CONVERTIBLE_BONDS:
-        return {"names": ["비유동전환사채", "전환사채(장기)"], "ids": []}
-    if account == BalanceSheetAccounts.LONG_TERM_INCOME_RECEIVED_IN_ADVANCE:
-        return {
-            "names": [],
-            "ids": ["dart_LongTermIncomeReceivedInAdvance"],
-        }
-    if account == BalanceSheetAccounts.LONG_TERM_ADVANCES_CUSTOMERS:
-        return {"names": ["장기선수금"], "ids": ["dart_LongTermAdvancesCustomers"]}
-
-    if account == BalanceSheetAccounts.EQUITY:
-        return {"names": ["자본총계"], "ids": ["ifrs-full_Equity"]}
-    if account == BalanceSheetAccounts.RETAINED_EARNINGS:
-        return {
-            "names": ["이익잉여금", "이익잉여금(결손금)"],
-            "ids": ["ifrs-full_RetainedEarnings"],
-        }
-    if account == BalanceSheetAccounts.ISSUED_CAPITAL:
-        return {"names": ["자본금"], "ids": ["ifrs-full_IssuedCapital"]}
-
-    if account == BalanceSheetAccounts.EQUITY_AND_LIABILITIES:
-        return {"names": ["자본과부채총계"], "ids": ["ifrs-full_EquityAndLiabilities"]}
+    return get_account_detail(ReportTypes.BS, account)
 
 
 def get_cis_account_detail(account: IncomeStatementAccounts):
-    if account == IncomeStatementAccounts.REVENUE:
-        return {"names": ["매출액"], "ids": ["ifrs-full_Revenue"]}
-    if account == IncomeStatementAccounts.REVENUE_FROM_SALE_OF_GOODS_PRODUCT:
-        return {
-            "names": ["제품매출", "제품매출액"],
-            "ids": [
-                "dart_RevenueFromSaleOfGoodsProduct",
-                "ifrs-full_RevenueFromSaleOfGoods",
-            ],
-        }
-    if account == IncomeStatementAccounts.REVENUE_FROM_SALE_OF_GOODS_MERCHANDISE:
-        return {
-            "names": ["상품매출", "상품매출액", "(1) 상품매출액"],
-            "ids": ["dart_RevenueFromSaleOfGoodsMerchandise"],
-        }
-    if account == IncomeStatementAccounts.COST_OF_SALES:
-        return {"names": ["매출원가"], "ids": ["ifrs-full_CostOfSales"]}
-    if account == IncomeStatementAccounts.COST_OF_SALES_FROM_SALE_OF_GOODS_PRODUCT:
-        return {
-            "names": ["제품매출원가"],
-            "ids": ["dart_CostOfSalesFromSaleOfGoodsProduct"],
-        }
-    if account == IncomeStatementAccounts.COST_OF_SALES_FROM_SALE_OF_GOODS_MERCHANDISE:
-        return {
-            "names": ["상품매출원가"],
-            "ids": [
-                "ifrs-full_CostOfMerchandiseSold",
-                "dart_CostOfSalesFromSaleOfGoods",
-            ],
-        }
-    if account == IncomeStatementAccounts.GROSS_PROFIT:
-        return {"names": ["매출총이익"], "ids": ["ifrs-full_GrossProfit"]}
-
-    if account == IncomeStatementAccounts.SELLING_GENERAL_ADMINISTRATIVE_EXPENSES:
-        return {
-            "names": ["판매비와관리비", "판매비", "관리비", "판매관리비", "판매비용"],
-            "ids": [
-                "dart_TotalSellingGeneralAdministrativeExpenses",
-                "ifrs-full_GeneralAndAdministrativeExpense",
-                "ifrs-full_SellingGeneralAndAdministrativeExpense",
-                "ifrs-full_SellingExpense",
-            ],
-        }
-
-    if account == IncomeStatementAccounts.OPERATING_INCOME_LOSS:
-        return {
-            "names": ["영업이익"],
-            "ids": [
-                "dart_OperatingIncomeLoss",
-                "ifrs-full_ProfitLossFromOperatingActivities",
-            ],
-        }
-    if account == IncomeStatementAccounts.PROFIT_LOSS:
-        return {
-            "names": ["당기순이익", "당기순이익(손실)"],
-            "ids": ["ifrs-full_ProfitLoss"],
-        }
+    return get_account_detail(ReportTypes.CIS, account)
 
 
 def get_cf_account_detail(account: CashFlowAccounts):
-    if account == CashFlowAccounts.OPERATING_ACTIVITIES:
-        return {
-            "names": ["영업활동현금흐름"],
-            "ids": [
-                "ifrs-full_CashFlowsFromUsedInOperatingActivities",
-                "ifrs-full_CashFlowsFromUsedInOperations",
-            ],
-        }
-    if account == CashFlowAccounts.PROFIT_LOSS:
-        return {"names": ["당기순이익"], "ids": ["ifrs-full_ProfitLoss"]}
-
-    # if (
-    #     account
-    #     == CashFlowAccounts.ADJUSTMENTS_FOR_ASSETS_LIABILITIES_OF_OPERATING_ACTIVITIES
-    # ):
-    #     return {
-    #         "names": [
-    #             "영업으로부터 창출된 현금흐름",
-    #             "영업에서 창출된 현금",
-    #             "영업으로부터창출된현금",
-    #             "영업에서 창출한 현금흐름",
-    #             "영업활동에서창출된현금흐름",
-    #         ],
-    #         "ids": [
-    #             "dart_NetCashflowsFromUsedInOperations",
-    #             "dart_AdjustmentsForAssetsLiabilitiesOfOperatingActivities",
-    #             "ifrs-full_OtherInflowsOutflowsOfCashClassifiedAsOperatingActivities",
-    #             "ifrs-full_AdjustmentsForReconcileProfitLoss",
-    #         ],
-    #     }
-
-    if account == CashFlowAccounts.INTEREST_PAID:
-        return {
-            "names": [
-                "이자지급",
-                "이자지급액",
-                "이자지급(영업)",
-            ],
-            "ids": [
-                "ifrs-full_InterestPaidClassifiedAsOperatingActivities",
-                "ifrs-full_InterestPaidClassifiedAsOperatingActivities",
-            ],
-        }
-    if account == CashFlowAccounts.INTEREST_RECEIVED:
-        return {
-            "names": ["이자수취", "이자수취(영업)", "이자수취액"],
-            "ids": ["ifrs-full_InterestReceivedClassifiedAsOperatingActivities"],
-        }
-
-    if account == CashFlowAccounts.INVESTING_ACTIVITIES:
-        return {
-            "names": ["투자활동현그흐름"],
-            "ids": ["ifrs-full_CashFlowsFromUsedInInvestingActivities"],
-        }
-    if account == CashFlowAccounts.PURCHASE_OF_FINANCIAL_INSTRUMENTS:
-        return {
-            "names": [
-                "단기금융상품의 증가",
-                "단기금융상품의 취득",
-                "장단기금융상품의 취득",
-                "금융상품의 증가",
-                "장기금융상품의 납입",
-                "장기금융상품의증가",
-                "장단기금융상품의 증가",
-                "장ㆍ단기금융상품의 증가",
-                "장,단기금융상품의 증가",
-            ],
-            "ids": [
-                "dart_PurchaseOfShortTermFinancialInstruments",
-                "dart_PurchaseOfLongTermFinancialInstruments",
-                "dart_PurchaseOfFinancialInstruments",
-                "ifrs-full_PurchaseOfFinancialInstrumentsClassifiedAsInvestingActivities",
-                "ifrs-full_PurchaseOfOtherLongtermAssetsClassifiedAsInvestingActivities",
-            ],
-        }
-    if account == CashFlowAccounts.SALES_OF_FINANCIAL_INSTRUMENTS:
-        return {
-            "names": [
-                "단기금융상품의 감소",
-                "장기금융상품의처분",
-                "장기금융상품의 감소",
-                "장단기금융상품의 처분",
-                "단기금융상품의 처분",
-                "장기금융상품의 해지",
-                "단기금융상품의 해지",
-                "장기금융상품의감소",
-                "단기금융상품의감소",
-                "장단기금융상품의 감소",
-                "장ㆍ단기금융상품의 감소",
-                "장,단기금융상품의 감소",
-            ],
-            "ids": [
-                "dart_ProceedsFromSalesOfShortTermFinancialInstruments",
-                "dart_ProceedsFromSalesOfLongTermFinancialInstruments",
-                "dart_ProceedsFromSalesOfFinancialInstruments",
-                "dart_ProceedsFromSalesOfOtherFinancialAssets",
-                "dart_ProceedsFromSalesOfOtherCurrentFinancialAssets",
-            ],
-        }
-
-    if account == CashFlowAccounts.PURCHASE_OF_PROPERTY_PLANT_AND_EQUIPMENT:
-        return {
-            "names": [
-                "유형자산의 취득",
-                "유형자산의취득",
-                "유형자산의 증가",
-                "유형자산 취득",
-            ],
-            "ids": [
-                "ifrs-full_PurchaseOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities",
-                "dart_PurchaseOfOtherPropertyPlantAndEquipment",
-            ],
-        }
-    if account == CashFlowAccounts.SALES_OF_PROPERTY_PLANT_AND_EQUIPMENT:
-        return {
-            "names": [
-                "유형자산의 처분",
-                "유형자산의 감소",
-                "유형자산 처분",
-                "유형자산 감소",
-            ],
-            "ids": [
-                "ifrs-full_ProceedsFromSalesOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities",
-            ],
-        }
-
-    if account == CashFlowAccounts.FINANCING_ACTIVITIES:
-        return {
-            "names": ["재무활동현금흐름"],
-            "ids": ["ifrs-full_CashFlowsFromUsedInFinancingActivities"],
-        }
-
-    if account == CashFlowAccounts.PROCEEDS_FROM_BORROWINGS:
-        return {
-            "names": [
-                "차입금의 증가",
-                "단기차입금의 차입",
-                "장기차입금의 차입",
-                "장기차입금의 증가",
-                "단기차입금의 증가",
-                "차입금의 순차입",
-                "단기차입금의차입",
-                "장기차입금의차입",
-                "단기차입금의 순증감",
-                "장기차입금의 증감",
-                "차입금의 차입",
-                "단기차입금의 순차입",
-                "장기차입금의 순차입",
-                "차입금및사채의 증가",
-                "장기차입금 및 사채의 차입",
-                "사채 및 장기차입금 차입",
-                "단기차입금의증가",
-                "유동성장기차입금의 차입",
-                "유동성장기차입금의 증가",
-                "장기차입금 차입",
-                "단기차입금 증가",
-                "차입금 차입",
-                "유동성장기부채및단기차입금의 차입",
-                "장기차입금의증가",
-                "단기차입금 및 사채의 차입",
-                "유동성차입금의 증가",
-                "차입금 및 사채의 차입",
-            ],
-            "ids": [
-                "dart_ProceedsFromShortTermBorrowings",
-                "dart_ProceedsFromLongTermBorrowings",
-                "ifrs-full_ProceedsFromBorrowingsClassifiedAsFinancingActivities",
-                "ifrs-full_ProceedsFromNoncurrentBorrowings",
-                "ifrs-full_ProceedsFromCurrentBorrowings",
-            ],
-        }
-    if account == CashFlowAccounts.REPAYMENTS_OF_BORROWINGS:
-        return {
-            "names": [
-                "유동성장기차입금의 상환",
-                "장기차입금의 상환",
-                "단기차입금의 상환",
-                "유동성장기차입금의 감소",
-                "장기차입금의 감소",
-                "단기차입금의 감소",
-                "유동장기차입금의 상환",
-                "차입금의 상환",
-                "차입금의 감소",
-                "차입금의 순상환",
-                "유동성장기차입금의상환",
-                "유동성 장기차입금의 상환",
-                "(유동성)장기차입금 상환",
-                "유동성장기차입금 상환",
-                "장기차입금의상환",
-                "단기차입금의상환",
-                "유동차입금의 상환",
-                "장기차입금 상환",
-                "차입금및사채의 상환",
-                "유동성차입금의 상환",
-                "장기차입금 및 사채의 상환",
-                "사채 및 장기차입금 상환",
-                "단기차입금의 순상환",
-                "차입금 상환",
-                "유동성단기차입금의 상환",
-                "단기차입금의감소",
-                "단기차입금 감소",
-                "유동성장기부채및단기차입금의 상환",
-                "유동성 장기차입금의 감소",
-                "유동성장차입금의 감소",
-                "단기차입금 및 사채의 상환",
-                "유동성차입금(기타)의 상환",
-                "유동성차입금의 감소",
-                "유동성자기차입금 상환",
-                "장기차입금 감소",
-                "유동성장기차입금의감소",
-            ],
-            "ids": [
-                "dart_RepaymentsOfLongTermBorrowings",
-                "dart_RepaymentsOfShortTermBorrowings",
-                "ifrs-full_RepaymentsOfBorrowingsClassifiedAsFinancingActivities",
-                "ifrs-full_RepaymentsOfCurrentBorrowings",
-                "ifrs-full_RepaymentsOfNoncurrentBorrowings",
-            ],
-        }
-
-    if account == CashFlowAccounts.DIVIDENDS_PAID:
-        return {
-            "names": ["배당금지급", "배당금의 지급"],
-            "ids": ["ifrs-full_DividendsPaidClassifiedAsFinancingActivities"],
-        }
+    return get_account_detail(ReportTypes.CF, account)
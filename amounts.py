@@ -0,0 +1,101 @@
+import logging
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from config import RoundingModes
+
+# 정수로 변환 가능한 금액 (ex. '1234', '-1234')
+INTEGER_AMOUNT_PATTERN = r"[+-]?\d+"
+
+
+def to_nullable_int(values: pd.Series) -> pd.Series:
+    """
+    OpenDART 의 문자열 금액을 nullable int64 로 변환
+    :return: 빈 값, 정수로 변환할 수 없는 값은 NA
+    """
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype("Int64")
+
+    text = values.astype(str).str.strip()
+    is_integer = text.str.fullmatch(INTEGER_AMOUNT_PATTERN).fillna(False)
+
+    parsed = pd.Series(pd.NA, index=values.index, dtype="Int64")
+    parsed[is_integer] = text[is_integer].astype("int64")
+    return parsed
+
+
+# 음수 부호. '-', 마이너스 기호(U+2212), 전각 하이픈(U+FF0D), en dash(U+2013), △, ▲
+NEGATIVE_SIGNS = "-−－–△▲"
+# 재무제표 주석 표의 금액 셀. (123), -123, −123, －123, △123 등은 음수
+# 괄호는 짝이 맞는 경우만 허용. '(123', '123)' 은 읽지 못한 셀로 경고
+AMOUNT_CELL_PATTERN = rf"^(?P<open>\()?(?P<sign>[{NEGATIVE_SIGNS}])?(?P<integer>\d+)(?:\.(?P<fraction>\d+))?(?(open)\))$"
+# 금액이 없는 셀 (ex. '', '-', '－')
+EMPTY_AMOUNT_CELL_PATTERN = rf"^[{NEGATIVE_SIGNS}]?$"
+# 금액으로 읽지 못한 셀을 경고에 표시하는 최대 개수
+UNPARSED_CELL_SAMPLES = 5
+# 금액 뒤에 붙는 주석 표시 (ex. '1,234(*1)', '1,234 *2', '1,234(주3)')
+FOOTNOTE_MARKER_PATTERN = r"\((?:\*|주)\d*\)|\*\d*|주\d+\)"
+# 숫자 사이의 구분자, 공백
+AMOUNT_SEPARATOR_PATTERN = r"[,\s]"
+
+
+def parse_amount_cells(cells: Sequence[str], multiplier: int = 1) -> np.ndarray:
+    """
+    주석 표의 금액 셀을 한 번에 정수로 변환
+    :param cells: 셀 텍스트
+    :param multiplier: 표의 단위(원, 천원, 백만원)를 원 단위로 맞추기 위해 곱하는 값
+    :return: int64 배열. 소수점 이하는 버림. '-', 빈 셀, 숫자가 아닌 셀은 0
+        숫자가 아닌 셀은 금액을 놓친 것일 수 있으므로 경고
+    """
+    text = pd.Series(cells, dtype=object).fillna("").astype(str)
+    text = text.str.replace(FOOTNOTE_MARKER_PATTERN, "", regex=True)
+    text = text.str.replace(AMOUNT_SEPARATOR_PATTERN, "", regex=True)
+
+    parts = text.str.extract(AMOUNT_CELL_PATTERN)
+
+    unparsed = parts["integer"].isna() & ~text.str.fullmatch(EMPTY_AMOUNT_CELL_PATTERN)
+    if unparsed.any():
+        samples = pd.Series(cells, dtype=object)[unparsed.to_numpy()]
+        logging.warning(
+            f"{unparsed.sum()} amount cells are not numbers and are read as 0: "
+            f"{samples.head(UNPARSED_CELL_SAMPLES).tolist()}"
+        )
+
+    # 정수 부분은 정수 연산으로 처리해서 큰 금액도 정확하게 변환
+    integers = parts["integer"].fillna("0").to_numpy().astype("int64") * multiplier
+    fractions = pd.to_numeric("0." + parts["fraction"].fillna("0")).to_numpy()
+    amounts = integers + np.trunc(fractions * multiplier).astype("int64")
+
+    is_negative = parts["open"].notna() | parts["sign"].notna()
+    return np.where(is_negative.to_numpy(), -amounts, amounts)
+
+
+def scale_amounts(
+    values, divisor: int, rounding: RoundingModes = RoundingModes.TRUNCATE
+) -> np.ndarray:
+    """
+    원 단위 금액을 정수 연산으로 한 번에 변환 (ex. divisor=1000 -> 천원 단위)
+    :param values: 정수 배열 (2차원 가능)
+    :param divisor: Units 의 값
+    :param rounding: 나누어 떨어지지 않는 경우 처리 방식
+    :return: int64 배열
+    """
+    values = np.asarray(values, dtype="int64")
+    if divisor == 1:
+        return values.copy()
+
+    quotients, remainders = np.divmod(values, divisor)
+    if rounding == RoundingModes.FLOOR:
+        return quotients
+    if rounding == RoundingModes.TRUNCATE:
+        # 음수는 0 방향으로 버림
+        return quotients + ((remainders != 0) & (values < 0))
+    if rounding == RoundingModes.HALF_UP:
+        # 0.5 이상은 0 에서 먼 방향으로 올림
+        abs_quotients, abs_remainders = np.divmod(np.abs(values), divisor)
+        abs_quotients += 2 * abs_remainders >= divisor
+        return np.where(values < 0, -abs_quotients, abs_quotients)
+
+    raise ValueError(f"Invalid rounding mode {rounding}")
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import aiohttp
+
+from cache import ResponseCache
+from client import DartStatusRetry
+from client import cache_json_response
+from client import cache_text_response
+from config import ASYNC_MAX_IN_FLIGHT
+from config import BASE_URL
+from config import RATE_LIMITED_HTTP_STATUS
+from config import REQUEST_BACKOFF_FACTOR
+from config import REQUEST_MAX_RETRIES
+from config import REQUEST_TIMEOUT
+from config import RETRY_HTTP_STATUSES
+from config import DartResponse
+from ratelimit import RateLimiter
+
+
+class AsyncDartClient:
+    """
+    DartClient 의 asyncio 버전. 하나의 이벤트 루프에서 많은 보고서를 동시에 불러올 때 사용
+    - 모든 요청이 하나의 semaphore 를 거치므로 동시에 진행 중인 요청은 max_in_flight 이하
+    - 재시도, 캐시, 요청 제한(rate_limiter) 정책은 DartClient 와 동일
+    - async with 안에서만 사용 (aiohttp session 생성, 종료)
+    """
+
+    def __init__(
+        self,
+        timeout=REQUEST_TIMEOUT,
+        max_retries: int = REQUEST_MAX_RETRIES,
+        backoff_factor: float = REQUEST_BACKOFF_FACTOR,
+        max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_in_flight = max_in_flight
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.session = None
+
+    async def __aenter__(self) -> "AsyncDartClient":
+        connect_timeout, read_timeout = self.timeout
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+            connector=aiohttp.TCPConnector(limit=self.max_in_flight),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    async def get(self, url: str, params: dict = None) -> aiohttp.ClientResponse:
+        """
+        연결 오류, 5xx, 429 응답은 backoff 후 재시도
+        :return: 본문을 모두 읽은 응답
+        """
+        is_opendart = self.rate_limiter is not None and url.startswith(BASE_URL)
+        for attempt in range(self.max_retries + 1):
+            # semaphore 를 잡기 전에 대기해서 대기 중인 요청이 연결을 차지하지 않도록 함
+            if is_opendart:
+                await self.rate_limiter.aacquire((params or {}).get("crtfc_key"))
+
+            try:
+                async with self.semaphore:
+                    async with self.session.get(url, params=params) as res:
+                        await res.read()
+
+                if res.status not in RETRY_HTTP_STATUSES:
+                    return res
+                if is_opendart and res.status == RATE_LIMITED_HTTP_STATUS:
+                    self.rate_limiter.on_limited()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff_factor * (2**attempt))
+
+        return res
+
+    async def get_json(self, url: str, params: dict = None) -> DartResponse:
+        if self.cache:
+            content = self.cache.get(url, params)
+            if content is not None:
+                return json.loads(content)
+
+        retry = DartStatusRetry(
+            self.rate_limiter, self.max_retries, self.backoff_factor
+        )
+        while True:
+            res = await self.get(url, params=params)
+            content = await res.read()
+            data = json.loads(content)
+            wait = retry.get_wait(data)
+            if wait is None:
+                break
+            await asyncio.sleep(wait)
+
+        cache_json_response(self.cache, url, params, data, content)
+        return data
+
+    async def get_text(self, url: str, params: dict = None) -> str:
+        if self.cache:
+            content = self.cache.get(url, params)
+            if content is not None:
+                return content.decode("utf-8")
+
+        res = await self.get(url, params=params)
+        text = await res.text()
+
+        cache_text_response(self.cache, url, params, res.status, text)
+        return text
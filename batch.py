@@ -0,0 +1,458 @@
+"""
+여러 회사의 사업보고서 데이터를 한 번에 취합
+
+모든 회사의 보고서를 하나의 worker pool(또는 이벤트 루프)에서 불러오고,
+응답 캐시, 회사 목록(corp index)도 모든 회사가 함께 사용
+
+ex) python batch.py 삼성전자 005930 00126380 --start-year 2021 --end-year 2022
+    python batch.py --all --start-year 2022 --end-year 2022 --combined -o output
+    python batch.py --all --start-year 2022 --end-year 2022 --dry-run
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import pandas as pd
+
+from async_client import AsyncDartClient
+from client import get_client
+from config import ASYNC_MAX_IN_FLIGHT
+from config import BATCH_EXECUTION_MODE
+from config import EXTRACT_PROCESSES
+from config import FETCH_MAX_IN_FLIGHT
+from config import FETCH_MAX_WORKERS
+from config import ExecutionModes
+from config import ReportCodes
+from config import Units
+from corps import Corp
+from corps import CorpRecord
+from planner import plan_requests
+from ratelimit import RequestBudgetExceeded
+from report_calculator import ReportCalculator
+from report_calculator import extract_frames
+from report_calculator import write_excel
+from utils import get_api_key
+from workers import amap_bounded
+from workers import get_process_pool
+from workers import map_bounded
+from workers import map_processes
+
+API_KEY = get_api_key()
+
+# corp_code 는 8자리, 종목코드(stock_code)는 6자리 숫자
+CORP_CODE_LENGTH = 8
+STOCK_CODE_LENGTH = 6
+
+# (회사, 연도, 분기)
+Filing = Tuple[ReportCalculator, int, ReportCodes]
+
+
+def resolve_corps(
+    identifiers: List[str], all_listed: bool = False, api_key: str = API_KEY
+) -> List[CorpRecord]:
+    """
+    :param identifiers: 회사명, corp_code, 종목코드
+    :param all_listed: True -> Corp.get_list 의 모든 상장회사
+    :return: 중복을 제외한 회사 목록. 찾을 수 없는 회사는 제외
+    """
+    corp_inst = Corp(api_key=api_key)
+    if all_listed:
+        return list(corp_inst.get_list())
+
+    corps = {}
+    for identifier in identifiers:
+        identifier = identifier.strip()
+        if not identifier:
+            continue
+
+        if identifier.isdigit() and len(identifier) == CORP_CODE_LENGTH:
+            corp = corp_inst.find_by_code(identifier)
+        elif identifier.isdigit() and len(identifier) == STOCK_CODE_LENGTH:
+            corp = corp_inst.find_by_stock_code(identifier)
+        else:
+            corp = corp_inst.find_by_name(identifier)
+
+        if corp:
+            corps.setdefault(corp.corp_code, corp)
+
+    return list(corps.values())
+
+
+class CorpFramesCollector:
+    """
+    회사, 연도, 분기 순서로 들어오는 보고서 데이터를 회사 단위로 모아서 on_corp 호출
+    회사의 보고서를 모두 받으면 바로 넘기고 저장하지 않으므로 메모리는 진행 중인 보고서만큼만 사용
+    """
+
+    def __init__(
+        self,
+        years: List[int],
+        on_corp: Callable[[ReportCalculator, Dict], None],
+    ):
+        """
+        :param on_corp: (회사, get_frames_by_year 형태의 데이터 또는 발생한 오류)
+        """
+        self.years = years
+        self.filings = ReportCalculator.get_filings(years)
+        self.on_corp = on_corp
+        self.results = []
+
+    def add(self, filing: Filing, result):
+        self.results.append(result)
+        if len(self.results) < len(self.filings):
+            return
+
+        results, self.results = self.results, []
+        calculator = filing[0]
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.on_corp(calculator, errors[0])
+        else:
+            self.on_corp(
+                calculator,
+                ReportCalculator.group_by_year(self.years, self.filings, results),
+            )
+
+
+def get_filing_frames(filing: Filing):
+    """
+    :return: 보고서 데이터. 한 회사의 오류로 전체 작업이 멈추지 않도록 오류는 반환
+        요청 한도를 넘은 경우는 이후 요청도 모두 실패하므로 전체 작업을 중단
+    """
+    calculator, year, report_code = filing
+    try:
+        return calculator.get_filing_frames(year, report_code)
+    except RequestBudgetExceeded:
+        raise
+    except Exception as e:
+        return e
+
+
+def get_filing_payload(filing: Filing):
+    calculator, year, report_code = filing
+    try:
+        return calculator.get_filing_report(year, report_code).get_payload()
+    except RequestBudgetExceeded:
+        raise
+    except Exception as e:
+        return e
+
+
+def extract_filing_frames(payload):
+    """
+    process pool 에서 실행. 원본 데이터를 불러오다 오류가 난 경우 그대로 반환
+    """
+    if isinstance(payload, Exception):
+        return payload
+
+    try:
+        return extract_frames(payload)
+    except Exception as e:
+        return e
+
+
+async def aget_filing_frames(
+    client: AsyncDartClient, filing: Filing, executor: Executor = None
+):
+    calculator, year, report_code = filing
+    try:
+        return await calculator.aget_filing_frames(
+            client, year, report_code, executor=executor
+        )
+    except RequestBudgetExceeded:
+        raise
+    except Exception as e:
+        return e
+
+
+def crawl(
+    calculators: List[ReportCalculator],
+    years: List[int],
+    on_corp: Callable[[ReportCalculator, Dict], None],
+    execution_mode: ExecutionModes = ExecutionModes(BATCH_EXECUTION_MODE),
+    max_workers: int = FETCH_MAX_WORKERS,
+    max_in_flight: int = None,
+    extract_processes: int = EXTRACT_PROCESSES,
+):
+    """
+    모든 회사의 보고서를 하나의 worker pool 에서 불러옴
+    결과는 회사 순서대로 on_corp 에 전달
+    :param max_in_flight: 동시에 진행 중인 최대 보고서 수
+        기본값은 THREADS -> FETCH_MAX_IN_FLIGHT, ASYNC -> ASYNC_MAX_IN_FLIGHT
+    :param extract_processes: 0 보다 크면 보고서는 쓰레드(또는 이벤트 루프)에서 불러오고
+        파싱과 추출은 모든 회사가 함께 사용하는 process pool 에서 처리
+    """
+    filings = [
+        (calculator, year, report_code)
+        for calculator in calculators
+        for year, report_code in ReportCalculator.get_filings(years)
+    ]
+    collector = CorpFramesCollector(years, on_corp)
+
+    if execution_mode == ExecutionModes.ASYNC:
+        asyncio.run(
+            acrawl(
+                filings,
+                collector,
+                max_in_flight or ASYNC_MAX_IN_FLIGHT,
+                extract_processes,
+            )
+        )
+        return
+
+    max_in_flight = max_in_flight or FETCH_MAX_IN_FLIGHT
+    if extract_processes:
+        payloads = map_bounded(
+            get_filing_payload,
+            filings,
+            mode=execution_mode,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+        results = map_processes(
+            extract_filing_frames,
+            payloads,
+            max_workers=extract_processes,
+            max_in_flight=max_in_flight,
+        )
+    else:
+        results = map_bounded(
+            get_filing_frames,
+            filings,
+            mode=execution_mode,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+
+    for filing, result in zip(filings, results):
+        collector.add(filing, result)
+
+
+async def acrawl(
+    filings: List[Filing],
+    collector: CorpFramesCollector,
+    max_in_flight: int,
+    extract_processes: int = EXTRACT_PROCESSES,
+):
+    # 모든 회사가 같은 client 를 사용하므로 동시에 진행 중인 HTTP 요청 수는 프로세스 전체 기준
+    async with AsyncDartClient(
+        cache=get_client().cache, rate_limiter=get_client().rate_limiter
+    ) as client:
+        executor = get_process_pool(extract_processes) if extract_processes else None
+        try:
+            results = amap_bounded(
+                lambda filing: aget_filing_frames(client, filing, executor),
+                filings,
+                max_in_flight=max_in_flight,
+            )
+            i = 0
+            async for result in results:
+                collector.add(filings[i], result)
+                i += 1
+        finally:
+            if executor:
+                executor.shutdown()
+
+
+def add_corp_columns(df: pd.DataFrame, calculator: ReportCalculator) -> pd.DataFrame:
+    df = df.copy()
+    df.insert(0, "corp_name", calculator.corp_name)
+    df.insert(0, "corp_code", calculator.corp_code)
+    return df
+
+
+def run_batch(
+    corps: List[CorpRecord],
+    start_year: int,
+    end_year: int,
+    is_connected: bool = True,
+    unit: Units = Units.THOUSAND,
+    is_accumulated: bool = False,
+    output_dir: str = ".",
+    combined: bool = False,
+    api_key: str = API_KEY,
+    execution_mode: ExecutionModes = ExecutionModes(BATCH_EXECUTION_MODE),
+    max_workers: int = FETCH_MAX_WORKERS,
+    max_in_flight: int = None,
+    extract_processes: int = EXTRACT_PROCESSES,
+) -> List[str]:
+    """
+    :param combined: True -> 모든 회사를 하나의 파일로 저장 (corp_code, corp_name 컬럼 추가)
+        False -> 회사별로 저장
+    :return: 저장한 파일 경로
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    years = list(range(start_year, end_year + 1))
+    calculators = [
+        ReportCalculator(
+            corp_code=corp.corp_code,
+            is_connected=is_connected,
+            unit=unit,
+            api_key=api_key,
+            use_registry=False,
+        )
+        for corp in corps
+    ]
+
+    filenames = []
+    quarter_dfs = []
+    year_dfs = []
+    failed = []
+
+    def on_corp(calculator: ReportCalculator, frames_by_year):
+        if isinstance(frames_by_year, Exception):
+            logging.error(
+                f"{calculator.corp_name}({calculator.corp_code}) 데이터 처리 실패",
+                exc_info=frames_by_year,
+            )
+            failed.append(calculator.corp_code)
+            return
+
+        df_by_quarter, df_by_year = calculator.assemble_data(
+            frames_by_year, is_accumulated=is_accumulated
+        )
+        if combined:
+            quarter_dfs.append(add_corp_columns(df_by_quarter, calculator))
+            year_dfs.append(add_corp_columns(df_by_year, calculator))
+            return
+
+        filename = os.path.join(
+            output_dir, calculator.get_filename(start_year, end_year)
+        )
+        write_excel(filename, df_by_quarter, df_by_year, unit)
+        filenames.append(filename)
+        print(f"{calculator.corp_name} 저장 완료: {filename}")
+
+    try:
+        crawl(
+            calculators,
+            years,
+            on_corp,
+            execution_mode=execution_mode,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+            extract_processes=extract_processes,
+        )
+    except RequestBudgetExceeded as e:
+        # 이미 처리한 회사는 그대로 저장
+        logging.error(f"요청 한도 초과로 중단: {e}")
+
+    if combined and quarter_dfs:
+        filename = os.path.join(
+            output_dir,
+            f"dart_{str(start_year)}_{str(end_year)}_unit_{unit.name.lower()}.xlsx",
+        )
+        write_excel(
+            filename,
+            pd.concat(quarter_dfs, ignore_index=True),
+            pd.concat(year_dfs, ignore_index=True),
+            unit,
+        )
+        filenames.append(filename)
+        print(f"{len(quarter_dfs)}개 회사 저장 완료: {filename}")
+
+    if failed:
+        print(f"{len(failed)}개 회사 처리 실패: {', '.join(failed)}")
+
+    return filenames
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="여러 회사의 사업보고서 데이터 취합")
+    parser.add_argument("corps", nargs="*", help="회사명, corp_code 또는 종목코드")
+    parser.add_argument("--corps-file", help="한 줄에 회사 하나씩 적은 파일")
+    parser.add_argument(
+        "--all", action="store_true", help="모든 상장회사 (Corp.get_list)"
+    )
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument("--end-year", type=int, required=True)
+    parser.add_argument(
+        "--separate", action="store_true", help="별도재무제표 (기본값: 연결재무제표)"
+    )
+    parser.add_argument(
+        "--unit", choices=[unit.name for unit in Units], default=Units.THOUSAND.name
+    )
+    parser.add_argument(
+        "--accumulated", action="store_true", help="분기별 값 대신 누적값 사용"
+    )
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument(
+        "--combined", action="store_true", help="모든 회사를 하나의 파일로 저장"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=[mode.value for mode in ExecutionModes],
+        default=BATCH_EXECUTION_MODE,
+    )
+    parser.add_argument("--max-workers", type=int, default=FETCH_MAX_WORKERS)
+    parser.add_argument(
+        "--max-in-flight", type=int, help="동시에 진행 중인 최대 보고서 수"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count(),
+        help="HTML 파싱, 표 추출에 사용하는 프로세스 수 (0: 보고서를 불러온 쓰레드에서 처리)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="요청하지 않고 필요한 요청 수, 예상 시간만 출력",
+    )
+    parser.add_argument("--api-key", default=API_KEY)
+    return parser
+
+
+def main(argv: List[str] = None):
+    args = get_parser().parse_args(argv)
+
+    identifiers = list(args.corps)
+    if args.corps_file:
+        with open(args.corps_file, encoding="utf-8") as f:
+            identifiers += f.read().splitlines()
+
+    if not identifiers and not args.all:
+        raise SystemExit("회사를 입력하거나 --all 을 사용하세요")
+
+    corps = resolve_corps(identifiers, all_listed=args.all, api_key=args.api_key)
+
+    # 캐시에 없는 요청 수로 비용을 계산하고, 적게 드는 회사부터 처리
+    plan = plan_requests(
+        corps,
+        list(range(args.start_year, args.end_year + 1)),
+        is_connected=not args.separate,
+        api_key=args.api_key,
+        cache=get_client().cache,
+    )
+    plan.print_summary(get_client().rate_limiter, api_key=args.api_key)
+    if args.dry_run:
+        return
+
+    print(f"{len(corps)}개 회사의 사업보고서 데이터를 처리 중입니다...")
+
+    run_batch(
+        plan.get_corps_by_priority(),
+        start_year=args.start_year,
+        end_year=args.end_year,
+        is_connected=not args.separate,
+        unit=Units[args.unit],
+        is_accumulated=args.accumulated,
+        output_dir=args.output_dir,
+        combined=args.combined,
+        api_key=args.api_key,
+        execution_mode=ExecutionModes(args.mode),
+        max_workers=args.max_workers,
+        max_in_flight=args.max_in_flight,
+        extract_processes=args.processes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import timedelta
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+from config import RESPONSE_CACHE_MAX_BYTES
+from config import RESPONSE_CACHE_PATH
+from config import RESPONSE_CACHE_TTLS
+
+# 캐시 키에서 제외하는 파라미터
+EXCLUDED_CACHE_PARAMS = ("crtfc_key",)
+
+
+def get_endpoint(url: str) -> str:
+    """
+    :return: url 의 마지막 경로. ex) fnlttSinglAcntAll.json, main.do
+    """
+    return urlsplit(url).path.rsplit("/", 1)[-1]
+
+
+class ResponseCache:
+    """
+    OpenDART, 공시뷰어 응답을 저장하는 SQLite 캐시
+    - 엔드포인트와 파라미터(crtfc_key 제외)로 키 생성
+    - 응답은 zlib 으로 압축해서 저장
+    - 최대 용량을 넘으면 가장 오래전에 사용한 응답부터 삭제 (LRU)
+    """
+
+    def __init__(
+        self,
+        path: str = RESPONSE_CACHE_PATH,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        ttls: dict = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = RESPONSE_CACHE_TTLS if ttls is None else ttls
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # 여러 프로세스에서 동시에 읽고 쓸 수 있도록 WAL 사용
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at"
+            " ON responses (accessed_at)"
+        )
+        self.conn.commit()
+
+        self.total_size = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def get_key(url: str, params: dict = None) -> str:
+        split = urlsplit(url)
+        query = parse_qsl(split.query) + list((params or {}).items())
+        query = sorted(
+            (key, str(val)) for key, val in query if key not in EXCLUDED_CACHE_PARAMS
+        )
+        raw = json.dumps([split.netloc, split.path, query], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, url: str) -> bool:
+        return get_endpoint(url) in self.ttls
+
+    def get_ttl(self, url: str):
+        return self.ttls.get(get_endpoint(url))
+
+    def contains(self, url: str, params: dict = None) -> bool:
+        return self.peek(url, params, with_body=False) is not None
+
+    def peek(self, url: str, params: dict = None, with_body: bool = True):
+        """
+        get 과 달리 읽기만 함. 사용 시각(LRU 순서)을 바꾸거나 만료된 응답을 지우지 않음
+        :param with_body: False 인 경우 응답을 읽지 않고 있는지만 확인
+        :return: 저장된 응답 (bytes, with_body=False 인 경우 b""). 없거나 만료된 경우 None
+        """
+        if not self.is_cacheable(url):
+            return None
+
+        key = self.get_key(url, params)
+        column = "body" if with_body else "x''"
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {column}, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return None
+
+        return zlib.decompress(row[0]) if with_body else b""
+
+    def get(self, url: str, params: dict = None):
+        """
+        :return: 저장된 응답 (bytes). 없거나 만료된 경우 None
+        """
+        if not self.is_cacheable(url):
+            return None
+
+        key = self.get_key(url, params)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, size, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, size, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                self.total_size -= size
+                return None
+
+            self.conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.conn.commit()
+
+        return zlib.decompress(body)
+
+    def set(self, url: str, params: dict, content: bytes, ttl: timedelta = None):
+        """
+        :param url:
+        :param params:
+        :param content: 응답 원문
+        :param ttl: None 인 경우 엔드포인트별 설정값 사용
+        """
+        if not self.is_cacheable(url):
+            return
+
+        if ttl is None:
+            ttl = self.get_ttl(url)
+
+        key = self.get_key(url, params)
+        body = zlib.compress(content)
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl.total_seconds()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.total_size -= row[0]
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, body, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, get_endpoint(url), body, len(body), expires_at, now),
+            )
+            self.total_size += len(body)
+
+            if self.total_size > self.max_bytes:
+                self.evict()
+
+            self.conn.commit()
+
+    def evict(self):
+        # 만료된 응답을 먼저 지운 뒤, 가장 오래전에 사용한 응답부터 삭제
+        self.conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        self.total_size = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        rows = self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        keys = []
+        for key, size in rows:
+            if self.total_size <= self.max_bytes:
+                break
+            keys.append((key,))
+            self.total_size -= size
+
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.total_size = 0
@@ -0,0 +1,227 @@
+import json
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cache import ResponseCache
+from cache import get_endpoint
+from config import BASE_URL
+from config import RATE_LIMIT_COOLDOWN
+from config import RATE_LIMIT_MAX_RETRIES
+from config import RATE_LIMITED_DART_STATUS
+from config import RATE_LIMITED_HTTP_STATUS
+from config import REQUEST_BACKOFF_FACTOR
+from config import REQUEST_MAX_RETRIES
+from config import REQUEST_POOL_SIZE
+from config import REQUEST_TIMEOUT
+from config import RESPONSE_CACHE_EMPTY_TTL
+from config import RESPONSE_CACHE_ENABLED
+from config import RETRY_DART_STATUSES
+from config import RETRY_HTTP_STATUSES
+from config import DartResponse
+from documents import TOC_NODE_PATTERN
+from ratelimit import RateLimiter
+from ratelimit import RequestBudgetExceeded
+from ratelimit import get_rate_limiter
+
+# 엔드포인트별 정상 페이지에만 있는 내용 (목차, 표)
+VALID_PAGE_PATTERNS = {
+    "main.do": TOC_NODE_PATTERN,
+    "viewer.do": re.compile(r"<table", re.IGNORECASE),
+}
+
+
+class DartStatusRetry:
+    """
+    get_json 한 번에 대한 OpenDART 상태 코드 처리. DartClient, AsyncDartClient 가 함께 사용
+    - 요청 제한 초과(020): rate_limiter 에 알린 뒤 재시도. 계속 020 이면 RequestBudgetExceeded
+    - 일시적인 오류(RETRY_DART_STATUSES): backoff 후 최대 max_retries 번 재시도
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter = None,
+        max_retries: int = REQUEST_MAX_RETRIES,
+        backoff_factor: float = REQUEST_BACKOFF_FACTOR,
+    ):
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.attempt = 0
+        self.limited = 0
+
+    def get_wait(self, data: DartResponse):
+        """
+        :return: 다시 요청하기 전에 기다릴 시간 (초). None 인 경우 응답을 그대로 사용
+        """
+        status = data.get("status")
+
+        if status == RATE_LIMITED_DART_STATUS:
+            self.limited += 1
+            if self.limited > RATE_LIMIT_MAX_RETRIES:
+                raise RequestBudgetExceeded(
+                    f"OpenDART keeps responding {status}: {data.get('message')}"
+                )
+            # rate_limiter 가 있으면 다음 요청 전에 rate_limiter 에서 대기
+            if self.rate_limiter:
+                self.rate_limiter.on_limited()
+                return 0
+            return RATE_LIMIT_COOLDOWN.total_seconds()
+
+        if self.rate_limiter:
+            self.rate_limiter.on_success()
+
+        if status not in RETRY_DART_STATUSES or self.attempt >= self.max_retries:
+            return None
+
+        wait = self.backoff_factor * (2**self.attempt)
+        self.attempt += 1
+        return wait
+
+
+def cache_json_response(
+    cache: ResponseCache, url: str, params: dict, data: DartResponse, content: bytes
+):
+    """
+    정상 응답만 저장. 조회된 데이터가 없는 경우(013)는 짧게 저장
+    """
+    if not cache:
+        return
+
+    if data.get("status") == "000":
+        cache.set(url, params, content)
+    elif data.get("status") == "013":
+        cache.set(url, params, content, ttl=RESPONSE_CACHE_EMPTY_TTL)
+
+
+def cache_text_response(
+    cache: ResponseCache, url: str, params: dict, status: int, text: str
+):
+    """
+    공시뷰어 페이지는 오류, 점검, 문서 없음 페이지도 200 으로 응답하므로
+    정상 페이지에만 있는 내용(VALID_PAGE_PATTERNS)이 있는 경우만 저장
+    """
+    if not cache or status != 200:
+        return
+
+    pattern = VALID_PAGE_PATTERNS.get(get_endpoint(url))
+    if pattern and not pattern.search(text):
+        return
+
+    cache.set(url, params, text.encode("utf-8"))
+
+
+class DartClient:
+    """
+    OpenDART API, DART 공시뷰어 요청에 공통으로 사용하는 HTTP 클라이언트
+    - 호스트별 connection pool, keep-alive 유지
+    - 연결 오류, 5xx 응답, 일시적인 OpenDART 오류 코드에 대해 backoff 후 재시도
+    - rate_limiter 가 있는 경우 모든 OpenDART 요청은 rate_limiter 를 거침.
+      요청 제한 초과(020) 응답은 속도를 줄인 뒤 재시도
+    - cache 가 있는 경우 정상 응답을 저장하고 이후 요청은 캐시에서 응답
+    """
+
+    def __init__(
+        self,
+        timeout=REQUEST_TIMEOUT,
+        max_retries: int = REQUEST_MAX_RETRIES,
+        backoff_factor: float = REQUEST_BACKOFF_FACTOR,
+        pool_size: int = REQUEST_POOL_SIZE,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # 재시도는 get 에서 처리해서 모든 재시도가 rate_limiter 를 거치도록 함
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, params: dict = None, **kwargs) -> requests.Response:
+        """
+        연결 오류, 5xx, 429 응답은 backoff 후 재시도
+        OpenDART 요청은 재시도를 포함한 매 요청마다 rate_limiter 를 거침
+        """
+        is_opendart = self.rate_limiter is not None and url.startswith(BASE_URL)
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            if is_opendart:
+                self.rate_limiter.acquire((params or {}).get("crtfc_key"))
+
+            try:
+                res = self.session.get(url, params=params, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if (
+                    res.status_code not in RETRY_HTTP_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    return res
+
+                res.close()
+                if is_opendart and res.status_code == RATE_LIMITED_HTTP_STATUS:
+                    self.rate_limiter.on_limited()
+
+            time.sleep(self.backoff_factor * (2**attempt))
+
+    def get_json(self, url: str, params: dict = None) -> DartResponse:
+        if self.cache:
+            content = self.cache.get(url, params)
+            if content is not None:
+                return json.loads(content)
+
+        retry = DartStatusRetry(
+            self.rate_limiter, self.max_retries, self.backoff_factor
+        )
+        while True:
+            res = self.get(url, params=params)
+            data = res.json()
+            wait = retry.get_wait(data)
+            if wait is None:
+                break
+            time.sleep(wait)
+
+        cache_json_response(self.cache, url, params, data, res.content)
+        return data
+
+    def get_text(self, url: str, params: dict = None) -> str:
+        if self.cache:
+            content = self.cache.get(url, params)
+            if content is not None:
+                return content.decode("utf-8")
+
+        res = self.get(url, params=params)
+        text = res.text
+
+        cache_text_response(self.cache, url, params, res.status_code, text)
+        return text
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> DartClient:
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DartClient(
+                    cache=ResponseCache() if RESPONSE_CACHE_ENABLED else None,
+                    rate_limiter=get_rate_limiter(),
+                )
+
+    return _client
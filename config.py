@@ -1,9 +1,109 @@
+import os
+from datetime import timedelta
 from enum import Enum
 from typing import List
 from typing import TypedDict
 
 BASE_URL = "https://opendart.fss.or.kr/api"
 
+# corpCode 등 내려받은 파일을 저장하는 경로. 실행 위치와 관계없이 같은 경로 사용
+CACHE_DIR = os.environ.get(
+    "DART_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"),
+)
+CORP_CODE_DIR = os.path.join(CACHE_DIR, "corpCode")
+# 내려받은 CORPCODE.xml 을 새로 받기까지의 기간
+CORP_CODE_TTL = timedelta(days=1)
+
+# OpenDART, 공시뷰어 응답 캐시
+RESPONSE_CACHE_ENABLED = os.environ.get("DART_RESPONSE_CACHE", "1") != "0"
+RESPONSE_CACHE_PATH = os.path.join(CACHE_DIR, "responses.sqlite3")
+# 압축된 응답 기준 최대 용량. 넘으면 오래전에 사용한 응답부터 삭제
+RESPONSE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# 엔드포인트별 캐시 유지 기간 (None: 만료 없음). 목록에 없는 엔드포인트는 캐시하지 않음
+# 접수번호(rcept_no)가 생긴 공시는 바뀌지 않으므로 기본적으로 만료 없음
+RESPONSE_CACHE_TTLS = {
+    "fnlttSinglAcntAll.json": None,
+    "empSttus.json": None,
+    "exctvSttus.json": None,
+    "hyslrSttus.json": None,
+    "main.do": None,
+    "viewer.do": None,
+}
+# 조회된 데이터가 없는 응답(013). 이후에 공시될 수 있으므로 짧게 유지
+RESPONSE_CACHE_EMPTY_TTL = timedelta(days=1)
+
+# 프로세스 안에서 재사용하는 Report 최대 개수
+REPORT_REGISTRY_SIZE = 128
+
+# 여러 보고서를 불러오는 방식 (sequential, threads, async)
+EXECUTION_MODE = os.environ.get("DART_EXECUTION_MODE", "sequential")
+# batch.py 에서 여러 회사를 불러오는 방식
+BATCH_EXECUTION_MODE = os.environ.get("DART_BATCH_EXECUTION_MODE", "threads")
+# 동시에 보고서를 불러오는 쓰레드 수
+FETCH_MAX_WORKERS = int(os.environ.get("DART_FETCH_MAX_WORKERS", 4))
+# 결과를 가져가기 전까지 동시에 진행 중인 최대 작업 수. 넘으면 먼저 제출한 작업이 끝날 때까지 대기
+FETCH_MAX_IN_FLIGHT = int(os.environ.get("DART_FETCH_MAX_IN_FLIGHT", 8))
+
+# HTML 파싱, 표 추출을 별도 프로세스에서 처리하는 경우 프로세스 수
+# 0: 보고서를 불러온 쓰레드(또는 이벤트 루프)에서 바로 처리
+EXTRACT_PROCESSES = int(os.environ.get("DART_EXTRACT_PROCESSES", 0))
+# async 방식에서 프로세스 전체에서 동시에 진행 중인 최대 HTTP 요청 수
+ASYNC_MAX_IN_FLIGHT = int(os.environ.get("DART_ASYNC_MAX_IN_FLIGHT", 200))
+
+# HTTP 요청 설정. timeout: (connect, read) 초 단위
+REQUEST_TIMEOUT = (5, 30)
+REQUEST_MAX_RETRIES = 3
+REQUEST_BACKOFF_FACTOR = 0.5
+# 호스트(opendart.fss.or.kr, dart.fss.or.kr)별로 유지하는 연결 수
+REQUEST_POOL_SIZE = 10
+# 재시도하는 HTTP 상태 코드
+RETRY_HTTP_STATUSES = (429, 500, 502, 503, 504)
+# 요청 제한 초과 HTTP 상태 코드. OpenDART 요청은 020 응답과 같이 RateLimiter 에서 속도를 줄임
+RATE_LIMITED_HTTP_STATUS = 429
+# 재시도하는 OpenDART 상태 코드 (800: 시스템 점검, 900: 정의되지 않은 오류)
+RETRY_DART_STATUSES = ("800", "900")
+
+# OpenDART 요청 제한. 요청 제한 초과(020) 응답은 RateLimiter 에서 처리
+RATE_LIMITED_DART_STATUS = "020"
+# 인증키별 하루 최대 요청 수. 한국 시간 자정에 초기화
+OPENDART_DAILY_BUDGET = int(os.environ.get("OPENDART_DAILY_BUDGET", 20000))
+# 하루 요청 수를 저장하는 경로. 같은 날 실행하는 모든 프로세스가 함께 사용
+REQUEST_BUDGET_PATH = os.path.join(CACHE_DIR, "request_budget.sqlite3")
+# 초당 요청 수, 쉬고 난 뒤 한 번에 보낼 수 있는 최대 요청 수
+OPENDART_REQUESTS_PER_SECOND = float(os.environ.get("OPENDART_REQUESTS_PER_SECOND", 10))
+OPENDART_BURST = 10
+# 020 응답을 받으면 요청 속도를 줄이고(최소 RATE_LIMIT_MIN_RATE) 잠시 모든 요청을 멈춤
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_MIN_RATE = 0.2
+RATE_LIMIT_COOLDOWN = timedelta(seconds=10)
+# 정상 응답마다 설정한 초당 요청 수의 일정 비율만큼 속도를 회복
+RATE_LIMIT_RECOVERY = 0.05
+# 020 응답에 대한 최대 재시도 횟수. 계속 020 이면 하루 한도를 넘은 것으로 보고 중단
+RATE_LIMIT_MAX_RETRIES = 5
+
+# 공시뷰어 HTML 파서. 지정하지 않으면 lxml 이 설치된 경우 lxml, 아니면 html.parser 사용
+HTML_PARSER = os.environ.get("DART_HTML_PARSER")
+# 공시뷰어 문서에서 사용하는 태그만 파싱할 때의 태그 목록
+HTML_STRAINER_TAGS = ("p", "table")
+# 태그만 골라서 파싱하면 감싸고 있던 div 등이 사라져 다른 영역의 문단과 표가 형제가 될 수 있음
+# scripts/bench_html_parsers.py 로 저장한 페이지의 결과가 같은지 확인한 경우에만 사용 (DART_HTML_PARSE_ONLY=1)
+# 빈 값이면 문서 전체를 파싱
+HTML_PARSE_ONLY_TAGS = (
+    HTML_STRAINER_TAGS if os.environ.get("DART_HTML_PARSE_ONLY") == "1" else None
+)
+
+
+class HtmlParsers(Enum):
+    LXML = "lxml"
+    HTML_PARSER = "html.parser"
+
+
+class ExecutionModes(Enum):
+    SEQUENTIAL = "sequential"
+    THREADS = "threads"
+    ASYNC = "async"
+
 
 class ReportCodes(Enum):
     Q1 = "11013"
@@ -12,6 +112,19 @@ class ReportCodes(Enum):
     Q4 = "11011"
 
 
+# 보고서 한 건을 처리할 때 보내는 요청
+class RequestSections(Enum):
+    FINANCIAL_DATA = "fnlttSinglAcntAll"
+    EMPLOYEE = "empSttus"
+    EXECUTIVES = "exctvSttus"
+    SHAREHOLDERS = "hyslrSttus"
+    # 공시뷰어 메인 페이지 (목차)
+    TOC = "main"
+    # 공시뷰어 문서 페이지 (재무제표 주석, 임원 및 직원 등의 현황)
+    FOOTNOTE = "footnote"
+    EXECUTIVES_PAGE = "executives"
+
+
 class ReportTypes(Enum):
     BS = "재무상태표"
     CIS = "포괄손익계산서"
@@ -25,6 +138,15 @@ class Units(Enum):
     MILLION = 1000 * 1000
 
 
+class RoundingModes(Enum):
+    # 0 방향으로 버림 (ex. -1.5 -> -1)
+    TRUNCATE = "truncate"
+    # 내림 (ex. -1.5 -> -2)
+    FLOOR = "floor"
+    # 반올림, 0.5 는 0 에서 먼 방향 (ex. -1.5 -> -2, 1.5 -> 2)
+    HALF_UP = "half_up"
+
+
 class DetailDataSjDivs(Enum):
     EXPENSE = "Expense detail"
     INVENTORY = "Inventory detail"
@@ -32,6 +154,13 @@ class DetailDataSjDivs(Enum):
     SHAREHOLDERS = "Shareholders detail"
 
 
+# 재무제표 주석의 섹션 제목, 항목명
+DETAIL_DATA_SECTIONS = {
+    DetailDataSjDivs.EXPENSE: ("비용", "비용의 성격별 분류"),
+    DetailDataSjDivs.INVENTORY: ("재고자산", "재고자산 내역"),
+}
+
+
 class AccountDetail(TypedDict):
     names: List[str]
     ids: List[str]
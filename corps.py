@@ -1,75 +1,374 @@
 import logging
 import os
-from io import BytesIO
-from xml.etree.ElementTree import parse
+import re
+import shutil
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from xml.etree.ElementTree import iterparse
+from zipfile import BadZipFile
 from zipfile import ZipFile
 
-import requests
 from pydash import py_
+from requests import RequestException
 
+from client import get_client
 from config import BASE_URL
+from config import CORP_CODE_DIR
+from config import CORP_CODE_TTL
 from utils import get_api_key
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 API_KEY = get_api_key()
 
+CORP_CODE_XML_NAME = "CORPCODE.xml"
+CORP_SNAPSHOT_NAME = "CORPCODE.snapshot"
+CORP_CODE_ZIP_NAME = "corpCode.zip"
+CORP_CODE_LOCK_NAME = "corpCode.lock"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 필터링 조건이나 레코드 구조가 바뀌면 버전을 올려서 기존 스냅샷을 무효화
+CORP_SNAPSHOT_VERSION = 2
+CORP_SNAPSHOT_MAGIC = b"DARTCORP"
+# magic, version, xml mtime(ns), xml size, 회사 수
+CORP_SNAPSHOT_HEADER = struct.Struct("<8sHqqI")
+CORP_SNAPSHOT_SEPARATOR = "\x1f"
+
+# 스팩, 펀드, 리츠 등 분석 대상이 아닌 회사명
+EXCLUDED_CORP_NAME_PATTERN = re.compile(
+    "스팩|펀드|자원개발|유한공사|기업인수목적|투자회사|리츠$"
+)
+
+
+class CorpRecord(NamedTuple):
+    corp_code: str
+    corp_name: str
+    stock_code: str
+    modify_date: str
+
+
+CORP_SNAPSHOT_FIELDS = CorpRecord._fields
+
+
+class CorpIndex:
+    """
+    필터링된 회사 목록과 corp_code, corp_name, stock_code 별 조회용 dict
+    """
+
+    def __init__(self, corp_list: List[CorpRecord]):
+        self.corp_list = corp_list
+        self.by_code: Dict[str, CorpRecord] = {}
+        self.by_name: Dict[str, CorpRecord] = {}
+        self.by_stock_code: Dict[str, CorpRecord] = {}
+
+        # 같은 이름의 회사가 있는 경우 기존과 동일하게 목록의 첫 번째 회사 사용
+        for corp in corp_list:
+            self.by_code.setdefault(corp.corp_code, corp)
+            self.by_name.setdefault(corp.corp_name, corp)
+            self.by_stock_code.setdefault(corp.stock_code, corp)
+
+
+# 프로세스 단위로 (cache_dir, ttl) 별로 한 번만 CORPCODE.xml 을 읽어서 공유
+_corp_indexes: Dict[tuple, CorpIndex] = {}
+_corp_index_lock = threading.Lock()
+
+
+def get_corp_index(
+    api_key: str = API_KEY,
+    cache_dir: str = CORP_CODE_DIR,
+    ttl: timedelta = CORP_CODE_TTL,
+) -> CorpIndex:
+    key = (os.path.abspath(cache_dir), ttl)
+
+    corp_index = _corp_indexes.get(key)
+    if corp_index is None:
+        with _corp_index_lock:
+            corp_index = _corp_indexes.get(key)
+            if corp_index is None:
+                corp_inst = Corp(api_key=api_key, cache_dir=cache_dir, ttl=ttl)
+                corp_index = CorpIndex(corp_inst.load_list())
+                _corp_indexes[key] = corp_index
+
+    return corp_index
+
+
+def reset_corp_index():
+    with _corp_index_lock:
+        _corp_indexes.clear()
+
+
+_download_lock = threading.Lock()
+
+
+@contextmanager
+def lock_file(path: str):
+    """
+    여러 프로세스가 같은 파일을 동시에 내려받지 않도록 path 에 배타적 잠금
+    fcntl 이 없는 환경(Windows)에서는 프로세스 안의 쓰레드만 막음
+    """
+    with _download_lock, open(path, "w") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
 
 class Corp:
-    def __init__(self, api_key=API_KEY):
+    def __init__(
+        self,
+        api_key=API_KEY,
+        cache_dir: str = CORP_CODE_DIR,
+        ttl: timedelta = CORP_CODE_TTL,
+    ):
+        """
+        :param api_key:
+        :param cache_dir: corpCode.zip, CORPCODE.xml 을 저장하는 경로
+        :param ttl: 내려받은 CORPCODE.xml 을 사용하는 기간. None 인 경우 계속 사용
+        """
         if not api_key:
             raise ValueError("API key is not valid")
         self.api_key = api_key
+        self.cache_dir = cache_dir
+        self.ttl = ttl
 
-    def get_list(self):
-        if not (
-            "corpCode" in os.listdir(".") and "CORPCODE.xml" in os.listdir("corpCode")
+    @property
+    def xml_path(self):
+        return os.path.join(self.cache_dir, CORP_CODE_XML_NAME)
+
+    @property
+    def snapshot_path(self):
+        return os.path.join(self.cache_dir, CORP_SNAPSHOT_NAME)
+
+    def is_expired(self, path: str) -> bool:
+        if self.ttl is None:
+            return False
+        return time.time() - os.path.getmtime(path) > self.ttl.total_seconds()
+
+    def is_stale(self) -> bool:
+        if not os.path.exists(self.xml_path):
+            return True
+        return self.is_expired(self.xml_path)
+
+    def refresh(self):
+        """
+        CORPCODE.xml 이 오래된 경우 새로 내려받음
+        내려받는 동안 다른 프로세스는 잠금에서 기다린 뒤, 이미 새로 받은 경우 그대로 사용
+        새로 받지 못한 경우 기존 CORPCODE.xml 이 있으면 경고 후 계속 사용
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with lock_file(os.path.join(self.cache_dir, CORP_CODE_LOCK_NAME)):
+            if not self.is_stale():
+                return
+
+            try:
+                self.download()
+            except (RequestException, BadZipFile, KeyError, OSError) as e:
+                if not os.path.exists(self.xml_path):
+                    raise
+                logging.warning(f"Failed to refresh {CORP_CODE_XML_NAME}: {e}")
+
+    def download(self):
+        """
+        corpCode.zip 을 조각 단위로 내려받은 뒤 CORPCODE.xml 을 교체
+        중단된 경우 남아있는 .part 파일부터 이어서 내려받음
+        .part 파일을 함께 사용하므로 refresh 의 잠금 안에서 호출
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        part_path = os.path.join(self.cache_dir, f"{CORP_CODE_ZIP_NAME}.part")
+
+        # 오래된 조각은 다른 버전의 파일일 수 있으므로 처음부터 다시 받음
+        if os.path.exists(part_path) and self.is_expired(part_path):
+            os.remove(part_path)
+
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        target_url = f"{BASE_URL}/corpCode.xml"
+        with get_client().get(
+            target_url,
+            params={"crtfc_key": self.api_key},
+            headers=headers,
+            stream=True,
+        ) as res:
+            # 416: 이미 모두 내려받은 경우
+            if res.status_code != 416:
+                res.raise_for_status()
+                # Range 를 지원하지 않으면 처음부터 다시 받음
+                mode = "ab" if res.status_code == 206 else "wb"
+                with open(part_path, mode) as f:
+                    for chunk in res.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+        # 같은 경로의 임시 파일에 압축을 푼 뒤 교체해서,
+        # 다른 프로세스가 쓰다 만 CORPCODE.xml 을 읽지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, ZipFile(part_path) as zipfile:
+                with zipfile.open(CORP_CODE_XML_NAME) as xml_file:
+                    shutil.copyfileobj(xml_file, f)
+            os.replace(tmp_path, self.xml_path)
+        except BadZipFile:
+            # 오류 응답 등 zip 파일이 아닌 경우 다음 실행에서 처음부터 다시 받음
+            os.remove(part_path)
+            raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        os.remove(part_path)
+
+    @property
+    def index(self) -> CorpIndex:
+        return get_corp_index(
+            api_key=self.api_key, cache_dir=self.cache_dir, ttl=self.ttl
+        )
+
+    @staticmethod
+    def get_snapshot_key(xml_path: str):
+        stat = os.stat(xml_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def write_snapshot(
+        corp_list: List[CorpRecord],
+        snapshot_key,
+        snapshot_path: str,
+    ):
+        """
+        필터링된 회사 목록을 컬럼 단위로 묶어서 저장
+        :param corp_list:
+        :param snapshot_key: 원본 CORPCODE.xml 의 (mtime, size)
+        :param snapshot_path:
+        """
+        mtime_ns, size = snapshot_key
+        chunks = [
+            CORP_SNAPSHOT_HEADER.pack(
+                CORP_SNAPSHOT_MAGIC,
+                CORP_SNAPSHOT_VERSION,
+                mtime_ns,
+                size,
+                len(corp_list),
+            )
+        ]
+        for field in CORP_SNAPSHOT_FIELDS:
+            column = CORP_SNAPSHOT_SEPARATOR.join(
+                getattr(corp, field) for corp in corp_list
+            ).encode("utf-8")
+            chunks.append(struct.pack("<I", len(column)))
+            chunks.append(column)
+
+        # 다른 프로세스가 쓰다 만 스냅샷을 읽지 않도록 임시 파일에 쓰고 교체
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(chunks))
+        os.replace(tmp_path, snapshot_path)
+
+    @staticmethod
+    def read_snapshot(snapshot_key, snapshot_path: str):
+        """
+        :return: 스냅샷이 없거나, 버전 또는 원본 xml 이 달라진 경우 None
+        """
+        try:
+            with open(snapshot_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        if len(data) < CORP_SNAPSHOT_HEADER.size:
+            return None
+
+        magic, version, mtime_ns, size, count = CORP_SNAPSHOT_HEADER.unpack_from(data)
+        if (
+            magic != CORP_SNAPSHOT_MAGIC
+            or version != CORP_SNAPSHOT_VERSION
+            or (mtime_ns, size) != tuple(snapshot_key)
         ):
-            target_url = f"{BASE_URL}/corpCode.xml"
-            res = requests.get(target_url, params={"crtfc_key": self.api_key})
+            return None
+
+        offset = CORP_SNAPSHOT_HEADER.size
+        columns = []
+        for _ in CORP_SNAPSHOT_FIELDS:
+            (length,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            column = data[offset : offset + length].decode("utf-8")
+            offset += length
+            columns.append(column.split(CORP_SNAPSHOT_SEPARATOR) if count else [])
+
+        if any(len(column) != count for column in columns):
+            return None
+
+        return [CorpRecord._make(values) for values in zip(*columns)]
 
-            with ZipFile(BytesIO(res.content)) as zipfile:
-                zipfile.extractall("corpCode")
+    def load_list(self):
+        if self.is_stale():
+            self.refresh()
+
+        snapshot_key = self.get_snapshot_key(self.xml_path)
+        corp_list = self.read_snapshot(snapshot_key, self.snapshot_path)
+        if corp_list is not None:
+            return corp_list
+
+        corp_list = self.parse_list(self.xml_path)
+        self.write_snapshot(corp_list, snapshot_key, self.snapshot_path)
+
+        return corp_list
 
-        xml_tree = parse("corpCode/CORPCODE.xml")
-        root = xml_tree.getroot()
+    @staticmethod
+    def parse_list(xml_path: str) -> List[CorpRecord]:
+        """
+        CORPCODE.xml 을 순차적으로 읽으면서 상장된 회사만 남김
+        """
         corp_list = []
-        for item in root.findall("list"):
-            corp_list.append(
-                {
-                    "corp_code": item.findtext("corp_code"),
-                    "corp_name": item.findtext("corp_name"),
-                    "stock_code": item.findtext("stock_code"),
-                    "modify_date": item.findtext("modify_date"),
-                }
+
+        context = iterparse(xml_path, events=("start", "end"))
+        _, root = next(context)
+        for event, item in context:
+            if event != "end" or item.tag != "list":
+                continue
+
+            corp = CorpRecord(
+                corp_code=item.findtext("corp_code"),
+                corp_name=item.findtext("corp_name"),
+                stock_code=item.findtext("stock_code"),
+                modify_date=item.findtext("modify_date"),
             )
 
-        corp_list = py_.filter(corp_list, lambda val: val["stock_code"] != " ")
+            # 이미 읽은 항목은 바로 비워서 메모리 사용량 유지
+            root.clear()
 
-        # Remove irrevalent values
-        corp_list = py_.filter(corp_list, lambda val: "스팩" not in val["corp_name"])
-        corp_list = py_.filter(corp_list, lambda val: "펀드" not in val["corp_name"])
-        corp_list = py_.filter(
-            corp_list, lambda val: "자원개발" not in val["corp_name"]
-        )
-        corp_list = py_.filter(
-            corp_list, lambda val: "유한공사" not in val["corp_name"]
-        )
-        corp_list = py_.filter(
-            corp_list, lambda val: "기업인수목적" not in val["corp_name"]
-        )
-        corp_list = py_.filter(
-            corp_list, lambda val: "투자회사" not in val["corp_name"]
-        )
-        corp_list = py_.filter(
-            corp_list, lambda val: not val["corp_name"].endswith("리츠")
-        )
+            # 비상장 회사
+            if not corp.stock_code or not corp.stock_code.strip():
+                continue
+
+            # Remove irrevalent values
+            if EXCLUDED_CORP_NAME_PATTERN.search(corp.corp_name):
+                continue
+
+            corp_list.append(corp)
 
         return corp_list
 
-    def find_by_name(self, name, corp_list=None):
-        if not corp_list:
-            corp_list = self.get_list()
+    def get_list(self):
+        return self.index.corp_list
 
-        target_corp = py_.find(corp_list, lambda val: val["corp_name"] == name)
+    def find_by_name(self, name, corp_list=None):
+        if corp_list:
+            target_corp = py_.find(corp_list, lambda val: val.corp_name == name)
+        else:
+            target_corp = self.index.by_name.get(name)
 
         if not target_corp:
             logging.warning(f"There is no corp of which name is {name}")
@@ -78,12 +377,25 @@ class Corp:
         return target_corp
 
     def find_by_code(self, code, corp_list=None):
-        if not corp_list:
-            corp_list = self.get_list()
+        if corp_list:
+            target_corp = py_.find(corp_list, lambda val: val.corp_code == code)
+        else:
+            target_corp = self.index.by_code.get(code)
 
-        target_corp = py_.find(corp_list, lambda val: val["corp_code"] == code)
         if not target_corp:
             logging.warning(f"There is no corp of which code is {code}")
             return None
 
         return target_corp
+
+    def find_by_stock_code(self, stock_code, corp_list=None):
+        if corp_list:
+            target_corp = py_.find(corp_list, lambda val: val.stock_code == stock_code)
+        else:
+            target_corp = self.index.by_stock_code.get(stock_code)
+
+        if not target_corp:
+            logging.warning(f"There is no corp of which stock code is {stock_code}")
+            return None
+
+        return target_corp
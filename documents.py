@@ -0,0 +1,211 @@
+import importlib.util
+import re
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from bs4 import BeautifulSoup as bs
+from bs4 import SoupStrainer
+from bs4 import Tag
+
+from config import HTML_PARSE_ONLY_TAGS
+from config import HTML_PARSER
+from config import HtmlParsers
+
+VIEWER_URL = "http://dart.fss.or.kr/report/viewer.do?"
+
+# 공시뷰어 메인 페이지(main.do)의 목차 정보
+TOC_NODE_PATTERN = re.compile(
+    r"\s+node[12]\['text'\][ =]+\"(.*?)\"\;"
+    r"\s+node[12]\['id'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['rcpNo'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['dcmNo'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['eleId'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['offset'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['length'\][ =]+\"(\d+)\";"
+    r"\s+node[12]\['dtd'\][ =]+\"(.*?)\";"
+    r"\s+node[12]\['tocNo'\][ =]+\"(\d+)\";"
+)
+
+
+class TocEntry(NamedTuple):
+    text: str
+    id: str
+    rcp_no: str
+    dcm_no: str
+    ele_id: str
+    offset: str
+    length: str
+    dtd: str
+    toc_no: str
+
+    @property
+    def viewer_url(self) -> str:
+        return f"{VIEWER_URL}rcpNo={self.rcp_no}&dcmNo={self.dcm_no}&eleId={self.ele_id}&offset={self.offset}&length={self.length}&dtd={self.dtd}"
+
+
+class ReportToc:
+    """
+    공시뷰어 메인 페이지의 목차. 보고서별로 한 번만 파싱한 뒤 목차 제목으로 조회
+    """
+
+    def __init__(self, html: str):
+        self.entries: List[TocEntry] = [
+            TocEntry._make(match) for match in TOC_NODE_PATTERN.findall(html or "")
+        ]
+
+        # 같은 제목이 여러 번 나오는 경우 첫 번째 항목 사용
+        self.by_title: Dict[str, TocEntry] = {}
+        for entry in self.entries:
+            self.by_title.setdefault(entry.text, entry)
+
+        # 키워드로 찾은 결과 저장
+        self.found: Dict[tuple, Optional[TocEntry]] = {}
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def get(self, title: str) -> Optional[TocEntry]:
+        return self.by_title.get(title)
+
+    def find(self, *keywords: str, exclude: str = None) -> Optional[TocEntry]:
+        """
+        :param keywords: 제목에 모두 포함되어야 하는 문자열
+        :param exclude: 제목에 포함되지 않아야 하는 문자열
+        :return: 목차 순서상 조건에 맞는 첫 번째 항목
+        """
+        key = (keywords, exclude)
+        if key not in self.found:
+            self.found[key] = next(
+                (
+                    entry
+                    for title, entry in self.by_title.items()
+                    if all(keyword in title for keyword in keywords)
+                    and not (exclude and exclude in title)
+                ),
+                None,
+            )
+
+        return self.found[key]
+
+    def find_footnote(self, is_connected: bool) -> Optional[TocEntry]:
+        """
+        :param is_connected: True -> 연결재무제표 주석, False -> (별도)재무제표 주석
+        """
+        if is_connected:
+            return self.find("주석", "연결")
+
+        return self.find("주석", exclude="연결")
+
+
+def get_html_parser(parser: str = HTML_PARSER) -> str:
+    """
+    :param parser: BeautifulSoup tree builder 이름. None 인 경우 사용 가능한 가장 빠른 파서
+    """
+    if parser:
+        return parser
+
+    if importlib.util.find_spec(HtmlParsers.LXML.value):
+        return HtmlParsers.LXML.value
+
+    return HtmlParsers.HTML_PARSER.value
+
+
+def parse_html(
+    html: str, parser: str = HTML_PARSER, parse_only=HTML_PARSE_ONLY_TAGS
+) -> bs:
+    """
+    :param parser: 'lxml', 'html.parser' 등. None 인 경우 get_html_parser 결과 사용
+    :param parse_only: 파싱할 태그 목록. 빈 값이면 문서 전체를 파싱
+    """
+    strainer = SoupStrainer(list(parse_only)) if parse_only else None
+    return bs(html, get_html_parser(parser), parse_only=strainer)
+
+
+# 'N. 제목' 형태의 섹션 제목 (ex. '25. 비용의 성격별 분류')
+SECTION_HEADER_PATTERN = re.compile(r"\d+\. (.+)", re.S)
+
+
+class ViewerDocument:
+    """
+    공시뷰어(viewer.do) 문서. 한 번만 파싱한 뒤 섹션 제목과 표를 조회
+    """
+
+    def __init__(
+        self, html: str, parser: str = HTML_PARSER, parse_only=HTML_PARSE_ONLY_TAGS
+    ):
+        self.soup = parse_html(html, parser=parser, parse_only=parse_only)
+        self.paragraphs: List[Tag] = self.soup.find_all("p")
+
+        # 번호가 붙은 섹션 제목 -> 제목 문단
+        self.sections: List[Tuple[str, Tag]] = []
+        for tag in self.paragraphs:
+            match = SECTION_HEADER_PATTERN.match(tag.text)
+            if match:
+                self.sections.append((match.group(1), tag))
+
+        self.found: Dict[tuple, Optional[Tag]] = {}
+        self.section_tables: Dict[str, Tuple[Optional[Tag], Optional[Tag]]] = {}
+
+    def find_section(self, title: str) -> Optional[Tag]:
+        """
+        :param title: 섹션 제목의 앞부분 (ex. '비용', '재고자산')
+        :return: 문서 순서상 첫 번째 섹션 제목 문단
+        """
+        key = ("section", title)
+        if key not in self.found:
+            self.found[key] = next(
+                (tag for text, tag in self.sections if text.startswith(title)), None
+            )
+
+        return self.found[key]
+
+    def find_paragraph(self, pattern: str, exclude: str = None) -> Optional[Tag]:
+        """
+        :param pattern: 문단 앞부분과 비교할 정규식
+        :param exclude: 문단에 포함되지 않아야 하는 문자열
+        """
+        key = ("paragraph", pattern, exclude)
+        if key not in self.found:
+            reg = re.compile(pattern)
+            self.found[key] = next(
+                (
+                    tag
+                    for tag in self.paragraphs
+                    if reg.match(tag.text) and not (exclude and exclude in tag.text)
+                ),
+                None,
+            )
+
+        return self.found[key]
+
+    @staticmethod
+    def iter_next_tables(tag: Tag, skip_empty: bool = True) -> Iterator[Tag]:
+        for sibling in tag.next_siblings:
+            if sibling.name != "table":
+                continue
+            if skip_empty and not sibling.text.strip():
+                continue
+            yield sibling
+
+    def get_section_tables(self, title: str) -> Tuple[Optional[Tag], Optional[Tag]]:
+        """
+        재무제표 주석은 섹션 제목 다음에 단위 표, 내용 표 순서로 구성
+        :return: (단위 표, 내용 표)
+        """
+        if title not in self.section_tables:
+            unit_table = None
+            content_table = None
+
+            header = self.find_section(title)
+            if header:
+                unit_table = next(self.iter_next_tables(header), None)
+            if unit_table:
+                content_table = next(self.iter_next_tables(unit_table), None)
+
+            self.section_tables[title] = (unit_table, content_table)
+
+        return self.section_tables[title]
@@ -1,5 +1,5 @@
 from config import Units
-from reports import ReportCalculator
+from report_calculator import ReportCalculator
 
 if __name__ == "__main__":
 
@@ -0,0 +1,247 @@
+"""
+크롤링 전에 필요한 요청 수와 예상 시간을 계산
+
+(회사 x 연도 x 분기 x 요청) 을 응답 캐시와 비교해서 실제로 보내야 하는 요청만 남김
+공시뷰어 페이지는 앞 단계 응답(접수번호, 목차)이 캐시에 있어야 url 을 알 수 있으므로
+없는 경우 보고서가 있다고 보고 최대 요청 수로 계산
+"""
+
+import json
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from cache import ResponseCache
+from config import OPENDART_BURST
+from config import OPENDART_REQUESTS_PER_SECOND
+from config import ReportCodes
+from config import RequestSections
+from corps import CorpRecord
+from ratelimit import RateLimiter
+from report_calculator import ReportCalculator
+from reports import FINANCIAL_DATA_URL
+from reports import Report
+from utils import get_api_key
+
+API_KEY = get_api_key()
+
+# Report.json_requests 의 lazy_property 이름별 요청
+JSON_REQUEST_SECTIONS = {
+    "financial_data": RequestSections.FINANCIAL_DATA,
+    "employee_data": RequestSections.EMPLOYEE,
+    "executives_data": RequestSections.EXECUTIVES,
+    "shareholders_data": RequestSections.SHAREHOLDERS,
+}
+OPENDART_SECTIONS = tuple(JSON_REQUEST_SECTIONS.values())
+# 목차에서 url 을 찾는 공시뷰어 문서 페이지
+PAGE_SECTIONS = (RequestSections.FOOTNOTE, RequestSections.EXECUTIVES_PAGE)
+
+
+class PlannedRequest(NamedTuple):
+    corp_code: str
+    year: int
+    report_code: ReportCodes
+    section: RequestSections
+    # 앞 단계 응답이 캐시에 없어서 아직 알 수 없는 경우 None
+    url: Optional[str]
+    params: Optional[dict]
+    is_cached: bool
+
+    @property
+    def is_opendart(self) -> bool:
+        return self.section in OPENDART_SECTIONS
+
+    @property
+    def key(self):
+        """
+        중복 요청 확인에 사용. url 을 아는 경우 응답 캐시와 같은 키
+        """
+        if self.url is None:
+            return self.corp_code, self.year, self.report_code, self.section
+
+        return ResponseCache.get_key(self.url, self.params)
+
+
+class RequestCost(NamedTuple):
+    opendart: int
+    viewer: int
+
+
+def plan_filing(report: Report, cache: ResponseCache = None) -> List[PlannedRequest]:
+    """
+    보고서 한 건에 필요한 요청. 캐시에 있는 응답은 is_cached=True
+    캐시는 읽기만 하므로 dry run 이 캐시의 LRU 순서를 바꾸지 않음
+    """
+
+    def planned(section: RequestSections, url: str = None, params: dict = None):
+        return PlannedRequest(
+            report.corp_code,
+            int(report.year),
+            report.report_code,
+            section,
+            url,
+            params,
+            url is not None and cache is not None and cache.contains(url, params),
+        )
+
+    requests = [
+        planned(JSON_REQUEST_SECTIONS[name], url, params)
+        for name, (url, params) in report.json_requests.items()
+    ]
+
+    content = (
+        cache.peek(FINANCIAL_DATA_URL, report.financial_data_params) if cache else None
+    )
+    if content is None:
+        requests += [planned(RequestSections.TOC)]
+        requests += [planned(section) for section in PAGE_SECTIONS]
+        return requests
+
+    # 캐시된 응답으로 접수번호, 목차를 확인. 보고서가 없으면(013) 공시뷰어 요청도 없음
+    report.__dict__["financial_data"] = json.loads(content)
+    if not report.url:
+        return requests
+
+    requests.append(planned(RequestSections.TOC, report.url))
+    toc_html = cache.peek(report.url)
+    if toc_html is None:
+        requests += [planned(section) for section in PAGE_SECTIONS]
+        return requests
+
+    report.__dict__["toc_html"] = toc_html.decode("utf-8")
+    page_urls = {
+        RequestSections.FOOTNOTE: report.footnote_url,
+        RequestSections.EXECUTIVES_PAGE: report.executives_url,
+    }
+    requests += [planned(section, url) for section, url in page_urls.items() if url]
+
+    return requests
+
+
+class RequestPlan:
+    """
+    회사별로 보내야 하는 요청 목록
+    - 같은 요청은 한 번만 포함 (ex. 같은 회사를 여러 번 입력한 경우)
+    - 우선순위는 남은 OpenDART 요청이 적은 회사부터.
+      하루 요청 한도 안에서 데이터를 모두 받는 회사 수가 가장 많도록 함
+    """
+
+    def __init__(self, corps: List[CorpRecord], years: List[int]):
+        self.corps = corps
+        self.years = years
+        self.requests: Dict[str, List[PlannedRequest]] = {
+            corp.corp_code: [] for corp in corps
+        }
+        self.keys = set()
+
+    def add(self, request: PlannedRequest):
+        if request.key in self.keys:
+            return
+
+        self.keys.add(request.key)
+        self.requests[request.corp_code].append(request)
+
+    def get_cost(self, corp_code: str) -> RequestCost:
+        """
+        :return: 캐시에 없어서 새로 보내야 하는 요청 수
+        """
+        pending = [req for req in self.requests[corp_code] if not req.is_cached]
+        opendart = sum(req.is_opendart for req in pending)
+        return RequestCost(opendart, len(pending) - opendart)
+
+    @property
+    def cost(self) -> RequestCost:
+        costs = [self.get_cost(corp.corp_code) for corp in self.corps]
+        return RequestCost(
+            sum(cost.opendart for cost in costs), sum(cost.viewer for cost in costs)
+        )
+
+    @property
+    def cached_count(self) -> int:
+        return sum(
+            req.is_cached for requests in self.requests.values() for req in requests
+        )
+
+    def get_corps_by_priority(self) -> List[CorpRecord]:
+        # 비용이 같으면 입력 순서 유지
+        return sorted(self.corps, key=lambda corp: self.get_cost(corp.corp_code))
+
+    def count_corps_within(self, budget: int) -> int:
+        """
+        :return: 우선순위 순서로 처리할 때 budget 안에서 모두 처리할 수 있는 회사 수
+        """
+        count = 0
+        for corp in self.get_corps_by_priority():
+            budget -= self.get_cost(corp.corp_code).opendart
+            if budget < 0:
+                break
+            count += 1
+
+        return count
+
+    def estimate_seconds(
+        self,
+        rate: float = OPENDART_REQUESTS_PER_SECOND,
+        burst: int = OPENDART_BURST,
+    ) -> float:
+        """
+        요청 제한(초당 rate 개, 처음 burst 개는 바로 요청) 기준 최소 소요 시간
+        공시뷰어 요청은 요청 제한을 거치지 않으므로 제외
+        """
+        return max(self.cost.opendart - burst, 0) / rate
+
+    def print_summary(self, rate_limiter: RateLimiter = None, api_key: str = None):
+        """
+        :param api_key: 남은 요청 수를 확인할 인증키
+        """
+        rate = rate_limiter.max_rate if rate_limiter else OPENDART_REQUESTS_PER_SECOND
+        burst = rate_limiter.burst if rate_limiter else OPENDART_BURST
+        remaining = rate_limiter.get_remaining(api_key) if rate_limiter else None
+        cost = self.cost
+
+        print(f"회사 {len(self.corps)}개, 연도 {len(self.years)}개")
+        print(f"캐시에 있는 요청: {self.cached_count}")
+        print(f"OpenDART 요청 (최대): {cost.opendart}")
+        print(f"공시뷰어 요청 (최대): {cost.viewer}")
+        print(
+            f"예상 시간: {self.estimate_seconds(rate, burst):.0f}초 (초당 {rate:g}건)"
+        )
+
+        if remaining is not None:
+            print(f"오늘 남은 요청 수: {remaining}")
+            if cost.opendart > remaining:
+                print(
+                    "요청 한도 안에서 처리 가능한 회사: "
+                    f"{self.count_corps_within(remaining)}/{len(self.corps)}"
+                )
+
+
+def plan_requests(
+    corps: List[CorpRecord],
+    years: List[int],
+    report_codes: List[ReportCodes] = None,
+    is_connected: bool = True,
+    api_key: str = API_KEY,
+    cache: ResponseCache = None,
+) -> RequestPlan:
+    """
+    :param report_codes: 기본값은 1분기 ~ 4분기(사업보고서)
+    :param cache: None 인 경우 모든 요청을 새로 보내는 것으로 계산
+    """
+    plan = RequestPlan(corps, years)
+    for corp in corps:
+        for year, report_code in ReportCalculator.get_filings(years, report_codes):
+            # 캐시된 응답만 채워 넣으므로 registry 의 Report 와 섞이지 않도록 새로 생성
+            report = Report(
+                corp_code=corp.corp_code,
+                year=year,
+                report_code=report_code,
+                is_connected=is_connected,
+                api_key=api_key,
+                corp_name=corp.corp_name,
+            )
+            for request in plan_filing(report, cache):
+                plan.add(request)
+
+    return plan
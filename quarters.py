@@ -0,0 +1,36 @@
+from typing import Tuple
+
+import numpy as np
+
+# 1분기, 반기, 3분기, 사업보고서
+QUARTERS_PER_YEAR = 4
+
+
+def deaccumulate(
+    accumulated: np.ndarray, present: np.ndarray, is_flow: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    누적값(1분기, 반기, 3분기 누적, 연간)을 분기별 값으로 한 번에 변환
+    행은 회사, 항목, 계정 구분 없이 쌓아서 사용할 수 있음
+    :param accumulated: (행, 연도, 4) int64 누적 금액
+    :param present: (행, 연도, 4) 해당 분기 보고서에 데이터가 있는지 여부
+    :param is_flow: (행,) 누적값을 변환할 행 (손익계산서, 현금흐름표, 비용의 성격별 분류)
+    :return: (분기별 금액, 값이 있는지 여부)
+        flow 항목은 4분기 = 연간 - 3분기 누적 (다른 분기도 동일하게 이전 분기 누적값을 뺌)
+        해당 분기나 바로 이전 분기 데이터가 없으면 값 없음
+        flow 가 아닌 항목은 누적값을 그대로 사용하고, 해당 분기 데이터가 없으면 값 없음
+    """
+    accumulated = np.asarray(accumulated, dtype="int64")
+    present = np.asarray(present, dtype=bool)
+    is_flow = np.asarray(is_flow, dtype=bool)[:, np.newaxis, np.newaxis]
+
+    # 1분기는 이전 분기 누적값 0
+    previous = np.zeros_like(accumulated)
+    previous[..., 1:] = accumulated[..., :-1]
+    previous_present = np.ones_like(present)
+    previous_present[..., 1:] = present[..., :-1]
+
+    values = np.where(is_flow, accumulated - previous, accumulated)
+    valid = np.where(is_flow, present & previous_present, present)
+
+    return values, valid
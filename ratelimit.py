@@ -0,0 +1,258 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from config import OPENDART_BURST
+from config import OPENDART_DAILY_BUDGET
+from config import OPENDART_REQUESTS_PER_SECOND
+from config import RATE_LIMIT_COOLDOWN
+from config import RATE_LIMIT_DECREASE_FACTOR
+from config import RATE_LIMIT_MIN_RATE
+from config import RATE_LIMIT_RECOVERY
+from config import REQUEST_BUDGET_PATH
+from utils import get_api_key
+
+API_KEY = get_api_key()
+
+# OpenDART 하루 요청 한도는 한국 시간 기준으로 초기화
+KST = timezone(timedelta(hours=9))
+
+
+class RequestBudgetExceeded(Exception):
+    """
+    하루 요청 한도를 모두 사용했거나, OpenDART 가 계속 요청 제한 초과(020)를 응답하는 경우
+    """
+
+
+def get_budget_day() -> date:
+    return datetime.now(KST).date()
+
+
+def get_key_hash(api_key: str) -> str:
+    """
+    인증키 원문 대신 저장하는 값
+    """
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+class RequestBudget:
+    """
+    인증키별 하루 요청 수를 SQLite 에 저장
+    같은 날 같은 인증키로 실행하는 모든 프로세스가 같은 한도를 나눠 사용
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = OPENDART_DAILY_BUDGET,
+        path: str = REQUEST_BUDGET_PATH,
+        api_key: str = API_KEY,
+    ):
+        """
+        :param api_key: 요청마다 인증키를 넘기지 않는 경우 사용하는 인증키
+        """
+        self.daily_budget = daily_budget
+        self.path = path
+        self.api_key = api_key
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # 인증키 구분 없이 저장하던 이전 테이블
+        self.conn.execute("DROP TABLE IF EXISTS request_budget")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS request_budgets (
+                key_hash TEXT NOT NULL,
+                day TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (key_hash, day)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_used(self, api_key: str = None) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT used FROM request_budgets WHERE key_hash = ? AND day = ?",
+                (
+                    get_key_hash(api_key or self.api_key),
+                    get_budget_day().isoformat(),
+                ),
+            ).fetchone()
+
+        return row[0] if row else 0
+
+    def get_remaining(self, api_key: str = None) -> int:
+        return max(self.daily_budget - self.get_used(api_key), 0)
+
+    @property
+    def used(self) -> int:
+        return self.get_used()
+
+    @property
+    def remaining(self) -> int:
+        return self.get_remaining()
+
+    def use(self, api_key: str = None) -> bool:
+        """
+        api_key 의 오늘 요청 수를 하나 늘림. 다른 프로세스와 동시에 호출해도 한도를 넘지 않음
+        :return: 한도를 모두 사용한 경우 False
+        """
+        if self.daily_budget <= 0:
+            return False
+
+        day = get_budget_day().isoformat()
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT INTO request_budgets (key_hash, day, used) VALUES (?, ?, 1)"
+                " ON CONFLICT (key_hash, day) DO UPDATE SET used = used + 1"
+                " WHERE used < ?",
+                (get_key_hash(api_key or self.api_key), day, self.daily_budget),
+            )
+            used = cursor.rowcount == 1
+            # 지난 날짜의 기록은 더 이상 사용하지 않음
+            self.conn.execute("DELETE FROM request_budgets WHERE day < ?", (day,))
+            self.conn.commit()
+
+        return used
+
+
+class RateLimiter:
+    """
+    OpenDART 요청 앞에서 사용하는 token bucket
+    - 초당 rate 개씩 토큰이 쌓이고 (최대 burst 개), 요청마다 토큰 하나를 사용
+    - 토큰이 없으면 쌓일 때까지 대기. 쓰레드, asyncio 에서 같은 인스턴스를 함께 사용
+    - 020 응답을 받으면 속도를 줄이고 cooldown 동안 모든 요청을 멈춤.
+      이후 정상 응답마다 조금씩 원래 속도로 회복
+    - budget 이 있는 경우 요청마다 하루 요청 수를 세고,
+      한도를 넘으면 요청하지 않고 RequestBudgetExceeded
+    """
+
+    def __init__(
+        self,
+        rate: float = OPENDART_REQUESTS_PER_SECOND,
+        burst: int = OPENDART_BURST,
+        budget: RequestBudget = None,
+        min_rate: float = RATE_LIMIT_MIN_RATE,
+        decrease_factor: float = RATE_LIMIT_DECREASE_FACTOR,
+        recovery: float = RATE_LIMIT_RECOVERY,
+        cooldown: timedelta = RATE_LIMIT_COOLDOWN,
+    ):
+        """
+        :param budget: None 인 경우 하루 요청 수를 제한하지 않음
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.decrease_factor = decrease_factor
+        self.recovery = recovery
+        self.cooldown = cooldown
+        self.budget = budget
+        self.lock = threading.Lock()
+
+        self.tokens = float(burst)
+        # 마지막으로 토큰을 계산한 시점
+        self.updated_at = time.monotonic()
+
+    @property
+    def remaining(self):
+        return self.get_remaining()
+
+    def get_remaining(self, api_key: str = None):
+        """
+        오늘 남은 요청 수. 제한이 없는 경우 None
+        :param api_key: None 인 경우 budget 의 기본 인증키
+        """
+        if self.budget is None:
+            return None
+
+        return self.budget.get_remaining(api_key)
+
+    def reserve(self, api_key: str = None) -> float:
+        """
+        요청 하나를 예약
+        :param api_key: 요청에 사용하는 인증키. 하루 요청 수는 인증키별로 계산
+        :return: 요청 전에 기다려야 하는 시간 (초)
+        """
+        if self.budget is not None and not self.budget.use(api_key):
+            raise RequestBudgetExceeded(
+                f"OpenDART daily request budget ({self.budget.daily_budget})"
+                " is exhausted"
+            )
+
+        with self.lock:
+            now = time.monotonic()
+            if now > self.updated_at:
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+            # 토큰이 모자라면 미리 빌려 쓰고, 다시 쌓일 때까지 대기
+            self.tokens -= 1
+
+            # 020 응답 후 멈춘 경우 updated_at(다시 토큰이 쌓이기 시작하는 시점)까지 대기
+            wait = self.updated_at - now
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+    def acquire(self, api_key: str = None):
+        wait = self.reserve(api_key)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, api_key: str = None):
+        wait = self.reserve(api_key)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_limited(self):
+        """
+        요청 제한 초과(020) 응답
+        """
+        with self.lock:
+            now = time.monotonic()
+            # 이미 멈춘 상태에서 동시에 보낸 요청들이 020 을 받은 경우 한 번만 반영
+            if now < self.updated_at:
+                return
+
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            # 남은 토큰을 비우고 cooldown 이후부터 다시 쌓이도록 함
+            self.tokens = min(self.tokens, 0.0)
+            self.updated_at = now + self.cooldown.total_seconds()
+
+    def on_success(self):
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(
+                    self.max_rate, self.rate + self.max_rate * self.recovery
+                )
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: str = API_KEY) -> RateLimiter:
+    """
+    프로세스 안의 모든 OpenDART 요청이 함께 사용하는 RateLimiter
+    :param api_key: 요청에 인증키가 없는 경우 하루 요청 수를 계산하는 인증키
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(budget=RequestBudget(api_key=api_key))
+
+    return _rate_limiter
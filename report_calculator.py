@@ -1,16 +1,60 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 from pydash import py_
 
+from amounts import scale_amounts
+from async_client import AsyncDartClient
+from client import get_client
+from config import EXECUTION_MODE
+from config import EXTRACT_PROCESSES
+from config import FETCH_MAX_IN_FLIGHT
+from config import FETCH_MAX_WORKERS
 from config import DetailDataSjDivs
+from config import ExecutionModes
 from config import ReportCodes
 from config import ReportTypes
+from config import RoundingModes
 from config import Units
 from corps import Corp
+from quarters import QUARTERS_PER_YEAR
+from quarters import deaccumulate
+from reports import FilingPayload
 from reports import Report
+from reports import get_report
 from utils import get_api_key
+from workers import get_process_pool
+from workers import map_bounded
+from workers import map_processes
 
 API_KEY = get_api_key()
 
+# 단위 변환 대상 (금액) 항목
+MONETARY_SJ_DIVS = [
+    ReportTypes.BS.name,
+    ReportTypes.CIS.name,
+    ReportTypes.CF.name,
+    DetailDataSjDivs.EXPENSE.name,
+    DetailDataSjDivs.INVENTORY.name,
+]
+# 누적값을 분기별 값으로 변환해야 하는 항목
+# 재무상태표, 재고자산 현황, 임직원 현황 -> 값 그대로 사용
+ACCUMULATED_SJ_DIVS = [
+    ReportTypes.CIS.name,
+    ReportTypes.CF.name,
+    DetailDataSjDivs.EXPENSE.name,
+]
+# 금액, 인원수가 아닌 항목
+NON_NUMERIC_SJ_DIVS = [DetailDataSjDivs.SHAREHOLDERS.name]
+KEY_COLUMNS = ["sj_div", "sj_nm", "account_nm"]
+RECORD_COLUMNS = KEY_COLUMNS + ["occurrence", "period", "amount"]
+
 
 class ReportCalculator:
     def __init__(
@@ -20,7 +64,25 @@ class ReportCalculator:
         is_connected: bool = False,
         unit: Units = Units.DEFAULT,
         api_key: str = API_KEY,
+        rounding: RoundingModes = RoundingModes.TRUNCATE,
+        execution_mode: ExecutionModes = ExecutionModes(EXECUTION_MODE),
+        max_workers: int = FETCH_MAX_WORKERS,
+        max_in_flight: int = FETCH_MAX_IN_FLIGHT,
+        extract_processes: int = EXTRACT_PROCESSES,
+        use_registry: bool = True,
     ):
+        """
+        :param unit: 금액 단위
+        :param rounding: 금액 단위 변환시 나누어 떨어지지 않는 경우 처리 방식
+        :param execution_mode: 여러 보고서를 불러오는 방식. 결과는 방식과 관계없이 동일
+        :param max_workers: THREADS 인 경우 동시에 보고서를 불러오는 쓰레드 수
+        :param max_in_flight: THREADS 인 경우 동시에 진행 중인 최대 보고서 수
+            ASYNC 인 경우 모든 보고서를 동시에 불러오고 HTTP 요청 수만 ASYNC_MAX_IN_FLIGHT 로 제한
+        :param extract_processes: 0 보다 크면 보고서는 쓰레드(또는 이벤트 루프)에서 불러오고
+            HTML 파싱, 표 추출, 계정 분류는 해당 개수의 프로세스에서 처리
+        :param use_registry: False 인 경우 보고서를 프로세스 전체의 report_registry 에 남기지 않음
+            여러 회사를 한 번에 처리할 때 처리가 끝난 보고서의 원본 데이터가 쌓이지 않도록 함
+        """
         if not corp_code and not corp_name:
             raise ValueError("Either corp_name or corp_code should be vaild")
 
@@ -33,226 +95,557 @@ class ReportCalculator:
         if not target_corp:
             raise ValueError("Invalid corp_code")
 
-        self.corp_code = target_corp["corp_code"]
-        self.corp_name = target_corp["corp_name"]
+        self.corp_code = target_corp.corp_code
+        self.corp_name = target_corp.corp_name
         self.is_connected = is_connected
         self.unit = unit
+        self.rounding = rounding
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.extract_processes = extract_processes
+        self.use_registry = use_registry
         self.api_key = None
         if api_key:
             self.api_key = api_key
 
-    @staticmethod
-    def reset_index_df(df: pd.DataFrame) -> pd.DataFrame:
-        return df.reset_index().drop(["index"], axis=1)
+    def refine_unit(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        금액 항목(MONETARY_SJ_DIVS)의 모든 금액 컬럼을 self.unit 단위로 한 번에 변환
+        분기별 계산이 끝난 원 단위 데이터에 마지막으로 한 번만 적용. 값이 없는 칸은 그대로 둠
+        """
+        if df.empty or self.unit == Units.DEFAULT:
+            return df
+
+        is_monetary = df.sj_div.isin(MONETARY_SJ_DIVS).to_numpy()
+        if not is_monetary.any():
+            return df
+
+        amount_cols = [col for col in df.columns if col not in KEY_COLUMNS]
+        values = df.loc[is_monetary, amount_cols].to_numpy(dtype=object)
+        has_value = pd.notna(values)
+        values[has_value] = scale_amounts(
+            values[has_value].astype("int64"), self.unit.value, rounding=self.rounding
+        )
 
-    def refine_unit(self, df):
-        for col in df.columns:
-            if df[col].dtype == int:
-                df[col] = df[col].apply(lambda val: int(val / self.unit.value))
+        df = df.copy()
+        df.loc[is_monetary, amount_cols] = values
 
         return df
 
-    def get_annual_data(
-        self, year: int, by_quarter: bool = True, is_accumulated: bool = False
-    ):
+    @staticmethod
+    def get_report_frames(report: Report) -> Dict[str, pd.DataFrame]:
         """
-        :param year
-        :param is_accumulated: True -> 별도의 처리없이 누적값 리턴
-        :param by_quarter: False -> 연간사업보고서 값만 리턴, True -> 분기별 보고서 리턴
-        :return:
+        보고서 한 건의 재무제표, 주석 데이터를 항목(sj_div)별로 취합
         """
-        # 연간사업보고서 정보만 취합
-        if not by_quarter:
-            report = Report(
+        frames = {}
+
+        # 재무상태표, 손익계산서, 현금흐름표
+        for report_type in ReportTypes:
+            print(f"\t{report_type.value} 데이터 처리 중...")
+            frames[report_type.name] = report.get_target_type_data(
+                report_type=report_type
+            )
+
+        # 재무제표 주석 (비용의 성격별 분류, 재고자산 내역, 임직원 현황) 및 최대주주 현황
+        for detail_data_sj_div in DetailDataSjDivs:
+            print(f"\t{detail_data_sj_div.value} 데이터 처리 중...")
+            if detail_data_sj_div == DetailDataSjDivs.EMPLOYEE_STATUS:
+                df = report.get_employee_df()
+            elif detail_data_sj_div == DetailDataSjDivs.SHAREHOLDERS:
+                df = report.get_main_shareholders_df()
+            else:
+                df = report.get_detail_data_df(detail_data_sj_div=detail_data_sj_div)
+            frames[detail_data_sj_div.name] = df
+
+        return frames
+
+    def get_filing_report(self, year: int, report_code: ReportCodes) -> Report:
+        if not self.use_registry:
+            return Report(
                 corp_code=self.corp_code,
                 year=year,
-                report_code=ReportCodes.Q4,
+                report_code=report_code,
                 is_connected=self.is_connected,
                 api_key=self.api_key,
+                corp_name=self.corp_name,
             )
 
-            annual_df = pd.DataFrame()
-            for report_type in ReportTypes:
-                print(f"\t{report_type.value} 데이터 처리 중...")
-                target_df = report.get_target_type_data(report_type=report_type)
-                target_df = self.refine_unit(target_df)
-                annual_df = self.reset_index_df(pd.concat([annual_df, target_df]))
+        return get_report(
+            corp_code=self.corp_code,
+            year=year,
+            report_code=report_code,
+            is_connected=self.is_connected,
+            api_key=self.api_key,
+        )
 
-            for detail_data_sj_div in DetailDataSjDivs:
-                print(f"\t{detail_data_sj_div.value} 데이터 처리 중...")
-                if detail_data_sj_div == DetailDataSjDivs.EMPLOYEE_STATUS:
-                    detail_data_df = report.get_employee_df()
-                elif detail_data_sj_div == DetailDataSjDivs.SHAREHOLDERS:
-                    detail_data_df = report.get_main_shareholders_df()
-                else:
-                    detail_data_df = report.get_detail_data_df(
-                        detail_data_sj_div=detail_data_sj_div, unit=self.unit
-                    )
+    def get_filing_frames(
+        self, year: int, report_code: ReportCodes, report: Report = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        :param report: 이미 불러온 보고서. 없으면 새로 불러옴
+        """
+        period = self.get_period(year, report_code)
+        print(f"{period} 데이터 처리 중...")
 
-                annual_df = self.reset_index_df(pd.concat([annual_df, detail_data_df]))
+        if report is None:
+            report = self.get_filing_report(year, report_code)
+        frames = self.get_report_frames(report)
 
-            if annual_df.empty:
-                return pd.DataFrame()
+        print(f"{period} 데이터 처리 완료\n")
+        return frames
 
-            return annual_df.rename(columns={"amount": str(year)})
+    @staticmethod
+    def get_filings(
+        years: List[int], report_codes: List[ReportCodes] = None
+    ) -> List[Tuple[int, ReportCodes]]:
+        """
+        :param report_codes: 기본값은 1분기 ~ 4분기(사업보고서)
+        :return: 연도, 분기 순서의 (year, report_code)
+        """
+        return [
+            (year, report_code)
+            for year in years
+            for report_code in report_codes or list(ReportCodes)
+        ]
 
-        # 분기별 컬럼명 저장
-        amount_cols = []
+    @staticmethod
+    def group_by_year(
+        years: List[int],
+        filings: List[Tuple[int, ReportCodes]],
+        results: Iterable[Dict[str, pd.DataFrame]],
+    ) -> Dict[int, Dict[ReportCodes, Dict[str, pd.DataFrame]]]:
+        frames_by_year = {year: {} for year in years}
+        for (year, report_code), frames in zip(filings, results):
+            frames_by_year[year][report_code] = frames
+
+        return frames_by_year
+
+    def get_frames_by_year(
+        self, years: List[int], report_codes: List[ReportCodes] = None
+    ) -> Dict[int, Dict[ReportCodes, Dict[str, pd.DataFrame]]]:
+        """
+        요청한 기간의 모든 보고서를 execution_mode 에 따라 한 번에 불러옴
+        동시에 불러오더라도 결과는 항상 연도, 분기 순서
+        :param report_codes: 기본값은 1분기 ~ 4분기(사업보고서)
+        """
+        if self.execution_mode == ExecutionModes.ASYNC:
+            # 새 이벤트 루프에서 실행. 이미 실행 중인 루프 안에서는 aget_frames_by_year 사용
+            return asyncio.run(self.aget_frames_by_year(years, report_codes))
+
+        filings = self.get_filings(years, report_codes)
+        if not self.extract_processes:
+            results = map_bounded(
+                lambda filing: self.get_filing_frames(*filing),
+                filings,
+                mode=self.execution_mode,
+                max_workers=self.max_workers,
+                max_in_flight=self.max_in_flight,
+            )
+            return self.group_by_year(years, filings, results)
+
+        # 쓰레드에서는 원본 데이터만 불러오고, 파싱과 추출은 process pool 에서 처리
+        payloads = map_bounded(
+            lambda filing: self.get_filing_report(*filing).get_payload(),
+            filings,
+            mode=self.execution_mode,
+            max_workers=self.max_workers,
+            max_in_flight=self.max_in_flight,
+        )
+        results = map_processes(
+            extract_frames,
+            payloads,
+            max_workers=self.extract_processes,
+            max_in_flight=self.max_in_flight,
+        )
 
-        # 각 항목별, 분기별 데이터프레임 저장
-        dfs_by_sj_div = {}
-        for i, report_code in enumerate(ReportCodes):
+        return self.group_by_year(years, filings, results)
 
-            print(f"{str(year)}.Q{i + 1} 데이터 처리 중...")
+    async def aget_filing_frames(
+        self,
+        client: AsyncDartClient,
+        year: int,
+        report_code: ReportCodes,
+        executor: Executor = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        :param executor: 있는 경우 파싱과 추출은 executor(process pool) 에서 처리
+        """
+        report = self.get_filing_report(year, report_code)
+        await report.aload(client)
 
-            amount_col_name = f"{str(year)}.{report_code.name}"
-            report = Report(
-                corp_code=self.corp_code,
-                year=year,
-                report_code=report_code,
-                is_connected=self.is_connected,
-                api_key=self.api_key,
-            )
+        if executor is None:
+            return self.get_filing_frames(year, report_code, report=report)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, extract_frames, report.get_payload()
+        )
 
-            has_quarter_data = False
-            # 분기별 재무상태표, 손익계산서, 현금흐름표 정보 취합
-            for report_type_idx, report_type in enumerate(ReportTypes):
-                print(f"\t{report_type.value} 데이터 처리 중...")
-                target_df = report.get_target_type_data(report_type=report_type)
-                target_df = self.refine_unit(target_df)
-
-                if report_type.name not in dfs_by_sj_div:
-                    dfs_by_sj_div[report_type.name] = []
-                dfs_by_sj_div[report_type.name].append(
-                    {"col_name": amount_col_name, "df": target_df}
+    async def aget_frames_by_year(
+        self,
+        years: List[int],
+        report_codes: List[ReportCodes] = None,
+        client: AsyncDartClient = None,
+        executor: Executor = None,
+    ) -> Dict[int, Dict[ReportCodes, Dict[str, pd.DataFrame]]]:
+        """
+        get_frames_by_year 의 asyncio 버전. 모든 보고서를 동시에 불러오고
+        동시에 진행 중인 HTTP 요청 수는 client 의 semaphore 로 제한
+        :param client: 여러 회사를 같은 이벤트 루프에서 처리하는 경우 공유해서 사용.
+            없으면 동기 client 와 같은 캐시를 사용하는 client 를 새로 생성
+        :param executor: 파싱과 추출에 사용할 process pool. 없고 extract_processes 가 있으면 새로 생성
+        """
+        if client is None:
+            async with AsyncDartClient(
+                cache=get_client().cache, rate_limiter=get_client().rate_limiter
+            ) as client:
+                return await self.aget_frames_by_year(
+                    years, report_codes, client, executor
                 )
 
-                if report_type_idx == 0 and not target_df.empty:
-                    has_quarter_data = True
-
-            # 분기 데이터가 있을 때에만 컬럼명 저장
-            if has_quarter_data:
-                amount_cols.append(amount_col_name)
-
-            # 분기별 재무제표 주석 (비용의 성격별 분류, 재고자산 내역, 임직원 현황) 취합
-            for detail_data_sj_div in DetailDataSjDivs:
-                print(f"\t{detail_data_sj_div.value} 데이터 처리 중...")
-                if detail_data_sj_div.name not in dfs_by_sj_div:
-                    dfs_by_sj_div[detail_data_sj_div.name] = []
-
-                if detail_data_sj_div == DetailDataSjDivs.EMPLOYEE_STATUS:
-                    df = report.get_employee_df()
-                elif detail_data_sj_div == DetailDataSjDivs.SHAREHOLDERS:
-                    df = report.get_main_shareholders_df()
-                else:
-                    df = report.get_detail_data_df(
-                        detail_data_sj_div=detail_data_sj_div, unit=self.unit
-                    )
-
-                dfs_by_sj_div[detail_data_sj_div.name].append(
-                    {"col_name": amount_col_name, "df": df}
+        if executor is None and self.extract_processes:
+            with get_process_pool(self.extract_processes) as executor:
+                return await self.aget_frames_by_year(
+                    years, report_codes, client, executor
                 )
 
-            print(f"{str(year)}.Q{i + 1} 데이터 처리 완료\n")
-
-        annual_df = pd.DataFrame()
-
-        # 항목별, 분기별 데이터프레임을 연간 단위로 합치는 작업
-        # Todo. 중간에 비어있는 데이터프레임 처리 (ex. 1,2분기에는 데이터가 있는데 3분기에는 없는 경우)
-        for sj_div in dfs_by_sj_div:
-            sj_div_df = pd.DataFrame()
-
-            for item in dfs_by_sj_div[sj_div]:
-                df = item["df"]
-                col_name = item["col_name"]
-
-                if df.empty:
-                    df = pd.DataFrame(
-                        [], columns=["sj_div", "sj_nm", "account_nm", col_name]
-                    )
-                else:
-                    df.rename(columns={"amount": col_name}, inplace=True)
-
-                if sj_div_df.empty:
-                    sj_div_df = df.copy()
-                else:
-                    sj_div_df = pd.merge(
-                        left=sj_div_df,
-                        right=df,
-                        left_on=["sj_div", "sj_nm", "account_nm"],
-                        right_on=["sj_div", "sj_nm", "account_nm"],
-                        how="outer",
-                    )
-                    sj_div_df.fillna(0, inplace=True)
-
-            if sj_div != DetailDataSjDivs.SHAREHOLDERS:
-                for col in sj_div_df.columns:
-                    if sj_div_df[col].dtype in [int, float]:
-                        sj_div_df[col] = sj_div_df[col].apply(int)
-
-            annual_df = self.reset_index_df(pd.concat([annual_df, sj_div_df]))
-
-        if annual_df.empty:
+        filings = self.get_filings(years, report_codes)
+        results = await asyncio.gather(
+            *(
+                self.aget_filing_frames(client, *filing, executor=executor)
+                for filing in filings
+            )
+        )
+
+        return self.group_by_year(years, filings, results)
+
+    def get_quarter_frames(
+        self, year: int
+    ) -> Dict[ReportCodes, Dict[str, pd.DataFrame]]:
+        """
+        1분기 ~ 4분기(사업보고서) 보고서를 한 번씩만 불러와서 항목별로 취합
+        """
+        return self.get_frames_by_year([year])[year]
+
+    @staticmethod
+    def get_records(period: str, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        보고서 한 건의 항목별 데이터를 (sj_div, sj_nm, account_nm, occurrence, period, amount) 형태로 변환
+        """
+        dfs = [df[KEY_COLUMNS + ["amount"]] for df in frames.values() if not df.empty]
+        if not dfs:
+            return pd.DataFrame(columns=RECORD_COLUMNS)
+
+        records = pd.concat(dfs, ignore_index=True)
+        records["amount"] = records["amount"].astype(object)
+        records["period"] = period
+        # 같은 보고서 안에서 같은 계정명이 여러 번 나오는 경우 (ex. 소계) 나온 순서대로 구분
+        records["occurrence"] = records.groupby(
+            KEY_COLUMNS, sort=False, dropna=False
+        ).cumcount()
+
+        return records[RECORD_COLUMNS]
+
+    @staticmethod
+    def get_wide_records(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        (sj_div, sj_nm, account_nm) x 기간 형태의 데이터를 get_records 형태로 변환
+        """
+        if df.empty:
+            return pd.DataFrame(columns=RECORD_COLUMNS)
+
+        df = df.copy()
+        df["occurrence"] = df.groupby(KEY_COLUMNS, sort=False, dropna=False).cumcount()
+        records = df.melt(
+            id_vars=KEY_COLUMNS + ["occurrence"],
+            var_name="period",
+            value_name="amount",
+        )
+        records["amount"] = records["amount"].astype(object)
+
+        return records[RECORD_COLUMNS]
+
+    @staticmethod
+    def pivot_records(records: List[pd.DataFrame], periods: List[str]) -> pd.DataFrame:
+        """
+        모든 기간의 데이터를 한 번에 (sj_div, sj_nm, account_nm) x 기간 형태로 변환
+        행은 처음 나온 순서, 컬럼은 periods 순서. 해당 기간에 없는 계정은 NaN
+        """
+        records = [df for df in records if not df.empty]
+        if not records:
+            return pd.DataFrame(columns=KEY_COLUMNS + periods)
+
+        long_df = pd.concat(records, ignore_index=True)
+        long_df["row"] = long_df.groupby(
+            KEY_COLUMNS + ["occurrence"], sort=False, dropna=False
+        ).ngroup()
+
+        keys = long_df.drop_duplicates("row").set_index("row")[KEY_COLUMNS]
+        amounts = long_df.pivot(index="row", columns="period", values="amount")
+        amounts = amounts.reindex(columns=periods).astype(object)
+
+        wide_df = pd.concat([keys, amounts], axis=1).reset_index(drop=True)
+        wide_df.columns.name = None
+
+        return wide_df
+
+    @staticmethod
+    def fill_year(df: pd.DataFrame, cols: List[str]) -> pd.Series:
+        """
+        해당 연도에 데이터가 있는 계정은 빠진 분기를 0 으로 채움
+        보고서가 없거나 보고서에 항목(sj_div) 데이터가 없는 분기는 이후 assemble_quarter_df 에서 다시 비움
+        :return: 해당 연도에 데이터가 있는 행
+        """
+        has_data = df[cols].notna().any(axis=1)
+        if has_data.any():
+            values = df.loc[has_data, cols].to_numpy(dtype=object)
+            values[pd.isna(values)] = 0
+            df.loc[has_data, cols] = values
+
+        return has_data
+
+    @staticmethod
+    def get_presence(
+        records: List[pd.DataFrame], sj_divs: pd.Series, periods: List[str]
+    ) -> np.ndarray:
+        """
+        :return: (행, 기간) 해당 기간 보고서에 행의 항목(sj_div) 데이터가 있는지 여부
+        """
+        pairs = pd.concat(
+            [
+                df[["sj_div", "period"]].drop_duplicates()
+                for df in records
+                if not df.empty
+            ]
+        )
+        table = pd.crosstab(pairs.sj_div, pairs.period).astype(bool)
+
+        return table.reindex(
+            index=sj_divs, columns=periods, fill_value=False
+        ).to_numpy()
+
+    def assemble_quarter_df(
+        self,
+        records: List[pd.DataFrame],
+        periods_by_year: Dict[int, List[str]],
+        is_accumulated: bool = False,
+    ) -> pd.DataFrame:
+        """
+        :param periods_by_year: 연도별 1분기 ~ 4분기 컬럼명
+        """
+        periods = [period for cols in periods_by_year.values() for period in cols]
+        df = self.pivot_records(records, periods)
+        if df.empty:
+            return df
+
+        has_data = np.column_stack(
+            [
+                np.repeat(
+                    self.fill_year(df, cols).to_numpy()[:, np.newaxis], len(cols), 1
+                )
+                for cols in periods_by_year.values()
+            ]
+        )
+
+        # 해당 분기 보고서에 항목(sj_div) 데이터가 없으면 0 이 아닌 빈 값
+        presence = self.get_presence(records, df.sj_div, periods)
+
+        # 누적 데이터인 경우 별도의 처리 없음
+        if not is_accumulated:
+            # 최대주주 지분율 등 숫자가 아닌 항목 제외
+            rows = ~df.sj_div.isin(NON_NUMERIC_SJ_DIVS).to_numpy()
+            values = df.loc[rows, periods].to_numpy(dtype=object)
+            values[~has_data[rows]] = 0
+
+            n_rows, n_years = rows.sum(), len(periods_by_year)
+            shape = (n_rows, n_years, QUARTERS_PER_YEAR)
+            quarter_values, valid = deaccumulate(
+                values.astype("int64").reshape(shape),
+                presence[rows].reshape(shape),
+                df.sj_div[rows].isin(ACCUMULATED_SJ_DIVS).to_numpy(),
+            )
+
+            values = quarter_values.reshape(n_rows, len(periods)).astype(object)
+            values[~(valid.reshape(n_rows, len(periods)) & has_data[rows])] = np.nan
+            df.loc[rows, periods] = values
+
+        df[periods] = df[periods].mask(~presence)
+
+        return self.refine_unit(df)
+
+    def get_year_df(self, year: int, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        사업보고서(4분기) 데이터만으로 연간 데이터 생성
+        """
+        df = self.pivot_records([self.get_records(str(year), frames)], [str(year)])
+        if df.empty:
             return pd.DataFrame()
 
-        # 누적 데이터인 경우 별도의 처리 없이 바로 return
-        if is_accumulated:
-            return annual_df
+        return self.refine_unit(df)
+
+    def get_annual_data(
+        self,
+        year: int,
+        by_quarter: bool = True,
+        is_accumulated: bool = False,
+        frames_by_quarter: Dict[ReportCodes, Dict[str, pd.DataFrame]] = None,
+    ):
+        """
+        :param year
+        :param is_accumulated: True -> 별도의 처리없이 누적값 리턴
+        :param by_quarter: False -> 연간사업보고서 값만 리턴, True -> 분기별 보고서 리턴
+        :param frames_by_quarter: 이미 불러온 보고서 데이터. 없으면 새로 불러옴
+        :return:
+        """
+        # 연간사업보고서 정보만 취합
+        if not by_quarter:
+            if frames_by_quarter is None:
+                frames_by_year = self.get_frames_by_year([year], [ReportCodes.Q4])
+                frames_by_quarter = frames_by_year[year]
+            return self.get_year_df(year, frames_by_quarter[ReportCodes.Q4])
+
+        if frames_by_quarter is None:
+            frames_by_quarter = self.get_quarter_frames(year)
 
-        sj_divs = annual_df.sj_div.unique().tolist()
-        # 손익계산서, 현금흐름표, 비용의 성격별 분류 -> 누적값에 대한 계산 필요
-        # 재무상태표, 재고자산 현황, 임직원 현황 -> 값 그대로 사용
-        sj_divs_need_calculation = ["CIS", "CF", DetailDataSjDivs.EXPENSE.name]
+        return self.get_quarter_df(
+            year, frames_by_quarter, is_accumulated=is_accumulated
+        )
 
-        # 계산의 편의를 위해 컬럼 역전. 기존에는 1분기 -> 4분기였다면, 4분기 -> 1분기 순으로 나열
-        reversed_cols = list(reversed(amount_cols))
+    @staticmethod
+    def get_period(year: int, report_code: ReportCodes) -> str:
+        return f"{str(year)}.{report_code.name}"
 
-        merged = pd.DataFrame()
+    @classmethod
+    def get_quarter_records(
+        cls, year: int, frames_by_quarter: Dict[ReportCodes, Dict[str, pd.DataFrame]]
+    ) -> Tuple[List[pd.DataFrame], List[str]]:
+        """
+        :return: (분기별 데이터, 분기 컬럼명)
+        """
+        records = []
+        periods = []
+        for report_code, frames in frames_by_quarter.items():
+            period = cls.get_period(year, report_code)
+            records.append(cls.get_records(period, frames))
+            periods.append(period)
 
-        for sj_div in sj_divs:
-            sj_div_df = annual_df[annual_df.sj_div == sj_div].copy()
+        return records, periods
 
-            if sj_div not in sj_divs_need_calculation:
-                merged = self.reset_index_df(pd.concat([merged, sj_div_df]))
-            else:
-                for i, col in enumerate(reversed_cols):
-                    try:
-                        prev_quarter_col = reversed_cols[i + 1]
-                        sj_div_df[col] = sj_div_df[col] - sj_div_df[prev_quarter_col]
-                    except IndexError:
-                        pass
-                merged = self.reset_index_df(pd.concat([merged, sj_div_df]))
+    def get_quarter_df(
+        self,
+        year: int,
+        frames_by_quarter: Dict[ReportCodes, Dict[str, pd.DataFrame]],
+        is_accumulated: bool = False,
+    ) -> pd.DataFrame:
+        records, periods = self.get_quarter_records(year, frames_by_quarter)
+        df = self.assemble_quarter_df(records, {year: periods}, is_accumulated)
+        if df.empty:
+            return pd.DataFrame()
 
-        return merged
+        return df
+
+    @classmethod
+    def merge_annual_dfs(
+        cls, annual_dfs: List[pd.DataFrame], periods: List[str] = None
+    ) -> pd.DataFrame:
+        """
+        :param periods: 결과 컬럼. 데이터가 없는 기간도 빈 컬럼으로 유지
+            None 인 경우 annual_dfs 에 있는 기간만 사용
+        """
+        records = []
+        found_periods = []
+        for annual_df in annual_dfs:
+            records.append(cls.get_wide_records(annual_df))
+            found_periods += [
+                col for col in annual_df.columns if col not in KEY_COLUMNS
+            ]
+
+        total_df = cls.pivot_records(records, periods or found_periods)
+
+        # Drop unused column
+        total_df.drop(["sj_div"], axis=1, inplace=True)
+
+        return total_df
 
     def get_annual_data_by_period(
         self, start_year: int, end_year: int, by_quarter=True, is_accumulated=False
     ):
-        total_df = pd.DataFrame()
-        join_on_columns = ["sj_div", "sj_nm", "account_nm"]
+        years = list(range(start_year, end_year + 1))
+        frames_by_year = self.get_frames_by_year(
+            years, None if by_quarter else [ReportCodes.Q4]
+        )
 
-        for i, year in enumerate(range(start_year, end_year + 1)):
-            print(f"{str(year)}년도 데이터 처리중...")
-            annual_data = self.get_annual_data(
-                year=year, by_quarter=by_quarter, is_accumulated=is_accumulated
-            )
-            if i == 0:
-                total_df = annual_data.copy()
-            else:
-                total_df = pd.merge(
-                    total_df,
-                    annual_data,
-                    left_on=join_on_columns,
-                    right_on=join_on_columns,
-                    how="outer",
+        annual_dfs = []
+        for year in years:
+            annual_dfs.append(
+                self.get_annual_data(
+                    year=year,
+                    by_quarter=by_quarter,
+                    is_accumulated=is_accumulated,
+                    frames_by_quarter=frames_by_year[year],
                 )
+            )
 
-            print(f"{str(year)}년도 데이터 처리 완료\n")
+        # 보고서가 하나도 없는 연도도 get_data_by_period 와 같이 빈 컬럼으로 유지
+        if by_quarter:
+            periods = [
+                self.get_period(year, report_code)
+                for year, report_code in self.get_filings(years)
+            ]
+        else:
+            periods = [str(year) for year in years]
 
-        # Drop unused column
-        total_df.drop(["sj_div"], axis=1, inplace=True)
+        return self.merge_annual_dfs(annual_dfs, periods)
 
-        return total_df
+    def get_data_by_period(
+        self, start_year: int, end_year: int, is_accumulated=False
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        분기별, 연도별 데이터를 같은 보고서에서 한 번에 취합
+        :return: (분기별 데이터, 연도별 데이터)
+        """
+        years = list(range(start_year, end_year + 1))
+        return self.assemble_data(
+            self.get_frames_by_year(years), is_accumulated=is_accumulated
+        )
+
+    def assemble_data(
+        self,
+        frames_by_year: Dict[int, Dict[ReportCodes, Dict[str, pd.DataFrame]]],
+        is_accumulated=False,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        연도별 데이터는 분기별 데이터를 위해 불러온 사업보고서(4분기)를 그대로 사용
+        모든 보고서의 데이터를 모은 뒤 마지막에 한 번만 표 형태로 변환
+        :param frames_by_year: get_frames_by_year 결과
+        :return: (분기별 데이터, 연도별 데이터)
+        """
+        quarter_records = []
+        periods_by_year = {}
+        year_records = []
+
+        for year, frames_by_quarter in frames_by_year.items():
+            records, periods = self.get_quarter_records(year, frames_by_quarter)
+            quarter_records += records
+            periods_by_year[year] = periods
+
+            year_records.append(
+                self.get_records(str(year), frames_by_quarter[ReportCodes.Q4])
+            )
+
+        quarter_df = self.assemble_quarter_df(
+            quarter_records,
+            periods_by_year,
+            is_accumulated=is_accumulated,
+        )
+        year_df = self.refine_unit(
+            self.pivot_records(year_records, [str(year) for year in frames_by_year])
+        )
+
+        return quarter_df.drop(["sj_div"], axis=1), year_df.drop(["sj_div"], axis=1)
+
+    def get_filename(self, start_year: int, end_year: int) -> str:
+        return f"{self.corp_name}_{str(start_year)}_{str(end_year)}_unit_{self.unit.name.lower()}.xlsx"
 
     def write_data(
         self,
@@ -262,49 +655,59 @@ class ReportCalculator:
         filename=None,
         cell_width=None,
     ):
-        df_by_quarter = self.get_annual_data_by_period(
-            start_year=start_year,
-            end_year=end_year,
-            is_accumulated=is_accumulated,
-            by_quarter=True,
-        )
-
-        df_by_year = self.get_annual_data_by_period(
+        df_by_quarter, df_by_year = self.get_data_by_period(
             start_year=start_year,
             end_year=end_year,
             is_accumulated=is_accumulated,
-            by_quarter=False,
         )
 
         if not filename:
-            filename = f"{self.corp_name}_{str(start_year)}_{str(end_year)}_unit_{self.unit.name.lower()}.xlsx"
-
-        # Formatting cell width in excel file
-        if not cell_width:
-            if self.unit == Units.DEFAULT:
-                cell_width = 16
-            elif self.unit == Units.THOUSAND:
-                cell_width = 12
-            else:
-                cell_width = 8
-
-        with pd.ExcelWriter(filename, engine="xlsxwriter") as writer:
-            df_by_quarter.to_excel(
-                writer,
-                sheet_name="Quarter",
-                index=False,
-                header=True,
-            )
-            df_by_year.to_excel(
-                writer,
-                sheet_name="Year",
-                index=False,
-                header=True,
-            )
+            filename = self.get_filename(start_year, end_year)
+
+        write_excel(filename, df_by_quarter, df_by_year, self.unit, cell_width)
+
+
+def extract_frames(payload: FilingPayload) -> Dict[str, pd.DataFrame]:
+    """
+    process pool 에서 실행. 네트워크 없이 원본 데이터만으로 보고서 한 건의 데이터를 추출
+    """
+    return ReportCalculator.get_report_frames(Report.from_payload(payload))
+
+
+def write_excel(
+    filename: str,
+    df_by_quarter: pd.DataFrame,
+    df_by_year: pd.DataFrame,
+    unit: Units = Units.DEFAULT,
+    cell_width=None,
+):
+    """
+    분기별, 연도별 데이터를 Quarter, Year 시트로 저장
+    """
+    # Formatting cell width in excel file
+    if not cell_width:
+        if unit == Units.DEFAULT:
+            cell_width = 16
+        elif unit == Units.THOUSAND:
+            cell_width = 12
+        else:
+            cell_width = 8
+
+    with pd.ExcelWriter(filename, engine="xlsxwriter") as writer:
+        df_by_quarter.to_excel(
+            writer,
+            sheet_name="Quarter",
+            index=False,
+            header=True,
+        )
+        df_by_year.to_excel(
+            writer,
+            sheet_name="Year",
+            index=False,
+            header=True,
+        )
 
-            workbook = writer.book
-            float_format = workbook.add_format({"num_format": "#,##0"})
-            for worksheet in [writer.sheets["Quarter"], writer.sheets["Year"]]:
-                worksheet.set_column(
-                    0, 1000, width=cell_width, cell_format=float_format
-                )
+        workbook = writer.book
+        float_format = workbook.add_format({"num_format": "#,##0"})
+        for worksheet in [writer.sheets["Quarter"], writer.sheets["Year"]]:
+            worksheet.set_column(0, 1000, width=cell_width, cell_format=float_format)
@@ -1,28 +1,79 @@
+import asyncio
 import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup as bs
 from pydash import py_
 
-from accounts import BalanceSheetAccounts
-from accounts import CashFlowAccounts
-from accounts import IncomeStatementAccounts
-from accounts import get_account_detail
+from account_classifier import get_account_classifier
+from amounts import parse_amount_cells
+from amounts import scale_amounts
+from amounts import to_nullable_int
+from client import get_client
 from config import BASE_URL
-from config import AccountDetail
+from config import DETAIL_DATA_SECTIONS
+from config import RATE_LIMITED_DART_STATUS
+from config import REPORT_REGISTRY_SIZE
 from config import DartResponse
 from config import DetailDataSjDivs
 from config import ReportCodes
 from config import ReportTypes
+from config import RoundingModes
 from config import Units
 from corps import Corp
+from documents import ReportToc
+from documents import ViewerDocument
+from ratelimit import RequestBudgetExceeded
 from utils import get_age
 from utils import get_api_key
+from utils import lazy_property
 from utils import remove_escape_characters
 
 API_KEY = get_api_key()
 
+FINANCIAL_DATA_URL = BASE_URL + "/fnlttSinglAcntAll.json"
+EMPLOYEE_URL = BASE_URL + "/empSttus.json"
+EXECUTIVES_URL = BASE_URL + "/exctvSttus.json"
+SHAREHOLDERS_URL = BASE_URL + "/hyslrSttus.json"
+
+RAW_AMOUNT_COLUMNS = ["thstrm_amount", "thstrm_add_amount"]
+RAW_CATEGORY_COLUMNS = ["bsns_year", "corp_code", "sj_div", "sj_nm", "account_id"]
+
+
+class FilingPayload(NamedTuple):
+    """
+    보고서 한 건의 원본 데이터 (OpenDART 응답, 공시뷰어 HTML)
+    네트워크 없이 Report 를 다시 만들 수 있으므로 다른 프로세스로 넘겨서 파싱할 때 사용
+    """
+
+    corp_code: str
+    corp_name: str
+    year: str
+    report_code: ReportCodes
+    is_connected: bool
+    api_key: str
+    financial_data: DartResponse
+    employee_data: DartResponse
+    executives_data: DartResponse
+    shareholders_data: DartResponse
+    toc_html: str
+    footnote_html: str
+    executives_html: str
+
+
+# FilingPayload 로 옮기는 lazy_property
+PAYLOAD_PROPERTIES = (
+    "financial_data",
+    "employee_data",
+    "executives_data",
+    "shareholders_data",
+    "toc_html",
+    "footnote_html",
+    "executives_html",
+)
+
 
 class Report:
     def __init__(
@@ -32,28 +83,147 @@ class Report:
         report_code: ReportCodes = ReportCodes.Q4,
         is_connected: bool = False,
         api_key: str = API_KEY,
+        corp_name: str = None,
     ):
-
+        """
+        :param corp_name: 이미 알고 있는 경우 회사 목록에서 다시 찾지 않음
+        """
         if not api_key:
             raise ValueError("API Key is not valid")
 
         self.corp_code = corp_code
 
-        corp_inst = Corp(api_key=api_key)
-        target_corp = corp_inst.find_by_code(corp_code)
-        if not target_corp:
-            raise ValueError("Invalid corp_code")
+        if not corp_name:
+            corp_inst = Corp(api_key=api_key)
+            target_corp = corp_inst.find_by_code(corp_code)
+            if not target_corp:
+                raise ValueError("Invalid corp_code")
+            corp_name = target_corp.corp_name
 
-        self.corp_name = target_corp["corp_name"]
+        self.corp_name = corp_name
         self.year = str(year)
         self.report_code = report_code
         self.is_connected = is_connected
         self.api_key = api_key
 
+    @classmethod
+    def from_payload(cls, payload: FilingPayload) -> "Report":
+        report = cls(
+            corp_code=payload.corp_code,
+            year=payload.year,
+            report_code=payload.report_code,
+            is_connected=payload.is_connected,
+            api_key=payload.api_key,
+            corp_name=payload.corp_name,
+        )
+        report.__dict__.update(
+            {name: getattr(payload, name) for name in PAYLOAD_PROPERTIES}
+        )
+        return report
+
+    def get_payload(self) -> FilingPayload:
+        """
+        아직 불러오지 않은 항목은 이 때 불러옴
+        """
+        return FilingPayload(
+            self.corp_code,
+            self.corp_name,
+            self.year,
+            self.report_code,
+            self.is_connected,
+            self.api_key,
+            *(getattr(self, name) for name in PAYLOAD_PROPERTIES),
+        )
+
+    # 아래 항목들은 처음 사용할 때 한 번만 불러옴
+    @lazy_property
+    def financial_data(self) -> DartResponse:
+        return self.get_data()
+
+    @lazy_property
+    def employee_data(self) -> DartResponse:
+        return get_client().get_json(EMPLOYEE_URL, params=self.report_params)
+
+    @lazy_property
+    def executives_data(self) -> DartResponse:
+        return get_client().get_json(EXECUTIVES_URL, params=self.report_params)
+
+    @lazy_property
+    def shareholders_data(self) -> DartResponse:
+        return get_client().get_json(SHAREHOLDERS_URL, params=self.report_params)
+
+    @lazy_property
+    def raw_df(self) -> pd.DataFrame:
         raw_df = self.get_raw_df()
-        rcept_no = raw_df["rcept_no"].iloc[0]
-        self.url = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + rcept_no
-        self.raw_df = raw_df.drop(["rcept_no"], axis=1)
+        if raw_df.empty:
+            return raw_df
+
+        return raw_df.drop(["rcept_no"], axis=1)
+
+    @lazy_property
+    def rcept_no(self):
+        """
+        접수번호. 보고서가 없는 경우 None
+        """
+        if not self.check_data_valid(self.financial_data):
+            return None
+
+        return self.financial_data["list"][0]["rcept_no"]
+
+    @lazy_property
+    def url(self):
+        if not self.rcept_no:
+            return None
+
+        return "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=" + self.rcept_no
+
+    @lazy_property
+    def toc_html(self) -> str:
+        """
+        공시뷰어 메인 페이지 (목차 포함)
+        """
+        if not self.url:
+            return ""
+
+        return get_client().get_text(self.url)
+
+    @lazy_property
+    def toc(self) -> ReportToc:
+        return ReportToc(self.toc_html)
+
+    @lazy_property
+    def footnote_url(self):
+        return self.get_footnote_url()
+
+    @lazy_property
+    def footnote_html(self):
+        if not self.footnote_url:
+            return None
+
+        return get_client().get_text(self.footnote_url)
+
+    @lazy_property
+    def footnote_document(self) -> ViewerDocument:
+        return ViewerDocument(self.footnote_html) if self.footnote_html else None
+
+    @lazy_property
+    def executives_url(self):
+        return self.get_executives_url()
+
+    @lazy_property
+    def executives_html(self):
+        if not self.executives_url:
+            return None
+
+        return get_client().get_text(self.executives_url)
+
+    @lazy_property
+    def executives_document(self) -> ViewerDocument:
+        return ViewerDocument(self.executives_html) if self.executives_html else None
+
+    @property
+    def fs_div(self):
+        return "CFS" if self.is_connected else "OFS"
 
     @property
     def report_params(self):
@@ -64,6 +234,25 @@ class Report:
             "reprt_code": self.report_code.value,
         }
 
+    @property
+    def financial_data_params(self):
+        return {
+            **self.report_params,
+            "fs_div": self.fs_div,
+        }
+
+    @property
+    def json_requests(self):
+        """
+        :return: OpenDART 응답을 불러오는 lazy_property 이름 -> (url, params)
+        """
+        return {
+            "financial_data": (FINANCIAL_DATA_URL, self.financial_data_params),
+            "employee_data": (EMPLOYEE_URL, self.report_params),
+            "executives_data": (EXECUTIVES_URL, self.report_params),
+            "shareholders_data": (SHAREHOLDERS_URL, self.report_params),
+        }
+
     def get_data(self) -> DartResponse:
         """
         :param corp_code:
@@ -73,16 +262,64 @@ class Report:
         :param api_key:
         :return:
         """
-        params = {
-            **self.report_params,
-            "fs_div": "CFS" if self.is_connected else "OFS",
+        return get_client().get_json(
+            FINANCIAL_DATA_URL, params=self.financial_data_params
+        )
+
+    async def aload(self, client):
+        """
+        lazy_property 로 불러오는 OpenDART 응답, 공시뷰어 페이지를 비동기로 한 번에 불러와서 저장
+        이후 동기 메서드는 저장된 값을 그대로 사용. 이미 불러온 항목은 다시 요청하지 않음
+        :param client: AsyncDartClient
+        """
+        await self.aload_properties(
+            client.get_json,
+            {
+                name: request
+                for name, request in self.json_requests.items()
+                if name not in self.__dict__
+            },
+        )
+
+        # 목차는 접수번호(rcept_no)를 확인한 뒤에 불러올 수 있음
+        if "toc_html" not in self.__dict__:
+            self.__dict__["toc_html"] = (
+                await client.get_text(self.url) if self.url else ""
+            )
+
+        # 주석, 임원 현황 페이지는 목차에서 찾은 url 로 불러옴. url 이 없으면 None
+        page_urls = {
+            "footnote_html": self.footnote_url,
+            "executives_html": self.executives_url,
         }
+        page_requests = {}
+        for name, url in page_urls.items():
+            if name in self.__dict__:
+                continue
+
+            if url:
+                page_requests[name] = (url, None)
+            else:
+                self.__dict__[name] = None
+
+        await self.aload_properties(client.get_text, page_requests)
 
-        res = requests.get(BASE_URL + "/fnlttSinglAcntAll.json", params=params)
-        return res.json()
+    async def aload_properties(self, fetch, sources: dict):
+        """
+        :param fetch: client.get_json 또는 client.get_text
+        :param sources: lazy_property 이름 -> (url, params)
+        """
+        results = await asyncio.gather(
+            *(fetch(url, params=params) for url, params in sources.values())
+        )
+        self.__dict__.update(zip(sources, results))
 
     @staticmethod
     def check_data_valid(res: DartResponse):
+        # 요청 제한 초과인 경우 빈 데이터로 처리하지 않고 중단
+        if res["status"] == RATE_LIMITED_DART_STATUS:
+            raise RequestBudgetExceeded(res.get("message"))
+
         if res["status"] == "013":
             return False
 
@@ -92,8 +329,7 @@ class Report:
         return True
 
     def get_employee_df(self) -> pd.DataFrame:
-        target_url = "https://opendart.fss.or.kr/api/empSttus.json"
-        res = requests.get(target_url, params=self.report_params).json()
+        res = self.employee_data
 
         if not self.check_data_valid(res):
             return pd.DataFrame()
@@ -140,8 +376,7 @@ class Report:
 
     def get_registered_executives_df(self) -> pd.DataFrame:
         # 등기 임원 현황 (via API)
-        url = "https://opendart.fss.or.kr/api/exctvSttus.json"
-        res = requests.get(url, params=self.report_params).json()
+        res = self.executives_data
 
         if not self.check_data_valid(res):
             return pd.DataFrame()
@@ -161,49 +396,29 @@ class Report:
             )
         return pd.DataFrame(data)
 
-    def get_unregistered_executives_df(self) -> pd.DataFrame:
-        res = requests.get(self.url)
-
-        reg = (
-            "\s+node[12]\['text'\][ =]+\"(.*?)\"\;"
-            "\s+node[12]\['id'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['rcpNo'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['dcmNo'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['eleId'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['offset'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['length'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['dtd'\][ =]+\"(.*?)\";"
-            "\s+node[12]\['tocNo'\][ =]+\"(\d+)\";"
-        )
-
-        matches = re.findall(reg, res.text)
-        if not matches:
-            return pd.DataFrame()
-
-        target = py_.find(matches, lambda m: "임원 및 직원 등의 현황" in m[0])
+    def get_executives_url(self):
+        """
+        '임원 및 직원 등의 현황' 공시뷰어 url
+        """
+        target = self.toc.find("임원 및 직원 등의 현황")
         if not target:
-            return pd.DataFrame()
-
-        viewer_url = "http://dart.fss.or.kr/report/viewer.do?"
-        target_url = f"{viewer_url}rcpNo={target[2]}&dcmNo={target[3]}&eleId={target[4]}&offset={target[5]}&length={target[6]}&dtd={target[7]}"
-
-        res = requests.get(target_url)
-        soup = bs(res.text, "html.parser")
+            return None
 
-        target_header = None
-        reg_pattern = r"(.+)\. 미등기임원"
+        return target.viewer_url
 
-        for tag in soup.find_all("p"):
-            if re.match(reg_pattern, tag.text) and "보수" not in tag.text:
-                # "미등기임원의 보수"
-                target_header = tag
-                break
+    def get_unregistered_executives_df(self) -> pd.DataFrame:
+        if not self.executives_document:
+            return pd.DataFrame()
 
+        # "미등기임원의 보수" 제외
+        target_header = self.executives_document.find_paragraph(
+            r"(.+)\. 미등기임원", exclude="보수"
+        )
         if not target_header:
             return pd.DataFrame()
 
-        target_table = py_.filter(
-            target_header.find_next_siblings(), lambda ele: ele and ele.name == "table"
+        target_table = list(
+            self.executives_document.iter_next_tables(target_header, skip_empty=False)
         )[1]
         data = []
 
@@ -224,6 +439,9 @@ class Report:
         if not unregistered_.empty:
             merged_ = pd.concat([merged_, unregistered_])
 
+        if merged_.empty:
+            return merged_
+
         custom_order = {"회장": 1, "부회장": 2, "대표이사": 3, "사장": 4, "부사장": 5}
         merged_["sort_order"] = merged_["ofcps"].apply(
             lambda val: 6 if val not in custom_order else custom_order[val]
@@ -233,8 +451,7 @@ class Report:
 
     # 최대 주주 주식 보유 현황
     def get_shareholders_df(self) -> pd.DataFrame:
-        url = "https://opendart.fss.or.kr/api/hyslrSttus.json"
-        res = requests.get(url, params=self.report_params).json()
+        res = self.shareholders_data
 
         if not self.check_data_valid(res):
             return pd.DataFrame()
@@ -256,6 +473,9 @@ class Report:
         shareholders_df = self.get_shareholders_df()
         executives_df = self.get_executives_df()
 
+        if shareholders_df.empty or executives_df.empty:
+            return pd.DataFrame()
+
         merged = pd.merge(
             shareholders_df,
             executives_df,
@@ -280,73 +500,28 @@ class Report:
         return merged[["sj_div", "sj_nm", "account_nm", "amount"]]
 
     def get_footnote_url(self):
-        res = requests.get(self.url)
-
-        reg = (
-            "\s+node[12]\['text'\][ =]+\"(.*?)\"\;"
-            "\s+node[12]\['id'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['rcpNo'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['dcmNo'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['eleId'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['offset'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['length'\][ =]+\"(\d+)\";"
-            "\s+node[12]\['dtd'\][ =]+\"(.*?)\";"
-            "\s+node[12]\['tocNo'\][ =]+\"(\d+)\";"
-        )
-
-        matches = re.findall(reg, res.text)
-
-        if not matches:
-            return None
-
-        candidates = py_.filter(matches, lambda m: "주석" in m[0])
-
-        if self.is_connected:
-            target = py_.find(candidates, lambda m: "연결" in m[0])
-        else:
-            target = py_.find(candidates, lambda m: "연결" not in m[0])
-
+        target = self.toc.find_footnote(is_connected=self.is_connected)
         if not target:
             return None
 
-        viewer_url = "http://dart.fss.or.kr/report/viewer.do?"
-        return f"{viewer_url}rcpNo={target[2]}&dcmNo={target[3]}&eleId={target[4]}&offset={target[5]}&length={target[6]}&dtd={target[7]}"
+        return target.viewer_url
 
     def get_detail_data_df(
-        self, detail_data_sj_div: DetailDataSjDivs, unit: Units = Units.DEFAULT
+        self,
+        detail_data_sj_div: DetailDataSjDivs,
+        unit: Units = Units.DEFAULT,
+        rounding: RoundingModes = RoundingModes.TRUNCATE,
     ) -> pd.DataFrame:
-        footnote_url = self.get_footnote_url()
-
-        if not footnote_url:
+        if not self.footnote_document:
             return pd.DataFrame()
-        res = requests.get(footnote_url)
-        soup = bs(res.text, "html.parser")
-
-        target_header = None
-        if detail_data_sj_div == DetailDataSjDivs.EXPENSE:
-            pair = re.compile(r"\d+\. 비용")
-            sj_div = DetailDataSjDivs.EXPENSE.name
-            sj_nm = "비용의 성격별 분류"
-        elif detail_data_sj_div == DetailDataSjDivs.INVENTORY:
-            pair = re.compile(r"\d+\. 재고자산")
-            sj_div = DetailDataSjDivs.INVENTORY.name
-            sj_nm = "재고자산 내역"
-        else:
-            raise ValueError("Not proper detail_data_type")
 
-        for tag in soup.find_all("p"):
-            if pair.match(tag.text):
-                target_header = tag
-                break
-        if not target_header:
-            return pd.DataFrame()
+        if detail_data_sj_div not in DETAIL_DATA_SECTIONS:
+            raise ValueError("Not proper detail_data_type")
 
-        unit_table = None
-        for tag in target_header.find_next_siblings():
-            if tag.name == "table" and tag.text.strip():
-                unit_table = tag
-                break
+        title, sj_nm = DETAIL_DATA_SECTIONS[detail_data_sj_div]
+        sj_div = detail_data_sj_div.name
 
+        unit_table, content_table = self.footnote_document.get_section_tables(title)
         if not unit_table:
             return pd.DataFrame()
 
@@ -367,15 +542,6 @@ class Report:
                 f"Invalid unit in detail data in {self.corp_name} {self.report_code} {detail_data_sj_div.name}"
             )
 
-        # 단위 조정
-        multiplied_by = unit_num / unit.value
-
-        content_table = None
-        for tag in unit_table.find_next_siblings():
-            if tag.name == "table" and tag.text.strip():
-                content_table = tag
-                break
-
         if not content_table:
             return pd.DataFrame()
 
@@ -390,35 +556,31 @@ class Report:
             col_index = len(theads) - 1
 
         # Extract data rows
-        data = []
+        account_nms = []
+        cells = []
         for row in content_table.find("tbody").find_all("tr"):
-            account_nm = remove_escape_characters(row.find_all("td")[0].text.strip())
-            amount = row.find_all("td")[col_index].text.strip().replace(",", "")
-
-            try:
-                amount_num = eval(amount)
-                # negative value
-                if re.match(r"\(\d+\)", amount):
-                    amount = -1 * amount_num
-                else:
-                    amount = amount_num
-
-            except SyntaxError:
-                amount = 0
+            tds = row.find_all("td")
+            account_nms.append(remove_escape_characters(tds[0].text.strip()))
+            cells.append(tds[col_index].text)
 
-            data.append(
-                {
-                    "sj_div": sj_div,
-                    "sj_nm": sj_nm,
-                    "account_nm": account_nm,
-                    "amount": int(amount * multiplied_by),
-                }
-            )
+        if not account_nms:
+            return pd.DataFrame()
 
-        return pd.DataFrame(data)
+        # 원 단위로 변환한 뒤 단위 조정
+        amounts = parse_amount_cells(cells, multiplier=unit_num)
+        amounts = scale_amounts(amounts, unit.value, rounding=rounding)
+
+        return pd.DataFrame(
+            {
+                "sj_div": sj_div,
+                "sj_nm": sj_nm,
+                "account_nm": account_nms,
+                "amount": amounts,
+            }
+        )
 
     def get_raw_df(self) -> pd.DataFrame:
-        data = self.get_data()
+        data = self.financial_data
         if not self.check_data_valid(data):
             return pd.DataFrame()
 
@@ -436,80 +598,96 @@ class Report:
             "thstrm_amount",
             "thstrm_add_amount",
         ]
+        df = df.reindex(columns=target_columns)
 
-        return df[target_columns]
-
-    @staticmethod
-    def get_account_amount(
-        report_df: pd.DataFrame, account_detail: AccountDetail
-    ) -> int:
-        filtered = pd.DataFrame()
-
-        names = account_detail["names"]
-        ids = account_detail["ids"]
-
-        for id in ids:
-            target_df = report_df[report_df.account_id == id]
-            filtered = pd.concat([filtered, target_df])
-
-        # 표준계정코드 미사용하는 경우 계정과목명과 직접 대조
-        for name in names:
-            stripped_name = name.replace(" ", "")
-            target_df = report_df[
-                (report_df.account_id == "-표준계정코드 미사용-")
-                & (
-                    report_df.account_nm.apply(
-                        lambda val: val.replace(" ", "") == stripped_name
-                    )
-                )
-            ]
-            filtered = pd.concat([filtered, target_df])
-
-        # 표준계정코드 미사용의 경우 계정과목명으로 비교
-        # 이 과정에서 중복되는 행 발생할 수 있음 (띄어쓰기 비교)
-        filtered.drop_duplicates(inplace=True)
-
-        # 분기 데이터
-        values = filtered.thstrm_amount.values
-        # 분기 누적 데이터
-        acc_values = filtered.thstrm_add_amount.values
-
-        total = 0
-        for val, acc_val in zip(values, acc_values):
-            # 값이 없는 경우를 제외하면 기본적으로 누적값 사용
-            # 분기별로 값을 처리하는 과정은 get_annual_data 함수에서 따로 진행
-            target_val = val if pd.isnull(acc_val) or not acc_val else acc_val
-            try:
-                parsed = int(target_val)
-                total += parsed
-            except ValueError:
-                continue
+        # 금액은 한 번만 정수로 변환하고, 반복되는 값은 category 로 저장
+        for col in RAW_AMOUNT_COLUMNS:
+            df[col] = to_nullable_int(df[col])
+        for col in RAW_CATEGORY_COLUMNS:
+            df[col] = df[col].astype("category")
 
-        return total
+        return df
 
     def get_target_type_data(self, report_type: ReportTypes) -> pd.DataFrame:
         if self.raw_df.empty:
             return pd.DataFrame()
 
         target_df = self.raw_df[self.raw_df.sj_div == report_type.name]
-        if report_type == ReportTypes.BS:
-            target_accounts = BalanceSheetAccounts
-        elif report_type == ReportTypes.CIS:
-            target_accounts = IncomeStatementAccounts
-        else:
-            target_accounts = CashFlowAccounts
+        return get_account_classifier(report_type).get_df(target_df)
 
-        rows = []
-        for account in target_accounts:
-            account_detail = get_account_detail(report_type, account)
-            rows.append(
-                {
-                    "sj_div": report_type.name,
-                    "sj_nm": report_type.value,
-                    "account_nm": account.value,
-                    "amount": self.get_account_amount(
-                        target_df, account_detail=account_detail
-                    ),
-                }
-            )
-        return pd.DataFrame(rows)
+
+class ReportRegistry:
+    """
+    (corp_code, year, report_code, fs_div) 별로 이미 불러온 Report 를 재사용
+    최대 개수를 넘으면 가장 오래전에 사용한 Report 부터 삭제 (LRU)
+    """
+
+    def __init__(self, maxsize: int = REPORT_REGISTRY_SIZE):
+        self.maxsize = maxsize
+        self.reports = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(
+        corp_code: str, year: int, report_code: ReportCodes, is_connected: bool
+    ):
+        return corp_code, str(year), report_code, "CFS" if is_connected else "OFS"
+
+    def get(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: ReportCodes = ReportCodes.Q4,
+        is_connected: bool = False,
+        api_key: str = API_KEY,
+    ) -> Report:
+        key = self.get_key(corp_code, year, report_code, is_connected)
+
+        with self.lock:
+            if key in self.reports:
+                self.reports.move_to_end(key)
+                return self.reports[key]
+
+        # 보고서를 불러오는 동안 다른 요청을 막지 않도록 lock 밖에서 생성
+        report = Report(
+            corp_code=corp_code,
+            year=year,
+            report_code=report_code,
+            is_connected=is_connected,
+            api_key=api_key,
+        )
+
+        with self.lock:
+            # 그 사이 다른 쓰레드에서 먼저 생성한 경우 해당 Report 사용
+            if key in self.reports:
+                self.reports.move_to_end(key)
+                return self.reports[key]
+
+            self.reports[key] = report
+            while len(self.reports) > self.maxsize:
+                self.reports.popitem(last=False)
+
+        return report
+
+    def clear(self):
+        with self.lock:
+            self.reports.clear()
+
+
+report_registry = ReportRegistry()
+
+
+def get_report(
+    corp_code: str,
+    year: int,
+    report_code: ReportCodes = ReportCodes.Q4,
+    is_connected: bool = False,
+    api_key: str = API_KEY,
+) -> Report:
+    return report_registry.get(
+        corp_code=corp_code,
+        year=year,
+        report_code=report_code,
+        is_connected=is_connected,
+        api_key=api_key,
+    )
@@ -0,0 +1,142 @@
+"""
+주석 표 금액 파서(parse_amount_cells)와 기존 eval 방식 비교
+
+임의로 생성한 셀과, 저장해둔 공시뷰어(viewer.do) 페이지의 모든 표 셀로 결과를 대조하고 시간을 측정
+
+python scripts/bench_amount_parser.py footnote.html --cells 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from amounts import NEGATIVE_SIGNS  # noqa: E402
+from amounts import parse_amount_cells  # noqa: E402
+from amounts import scale_amounts  # noqa: E402
+from documents import ViewerDocument  # noqa: E402
+
+# 기존 eval 방식으로 처리할 수 있는 셀 (ex. '1,234', '(1,234)', '-', '')
+LEGACY_CELL_PATTERN = re.compile(r"^(\(?[\d,]+\)?|-?[\d,]*|-)$")
+
+
+def parse_legacy(cell: str, multiplier: float = 1) -> int:
+    """
+    기존 Report.get_detail_data_df 의 셀 처리
+    """
+    amount = cell.strip().replace(",", "")
+    try:
+        amount_num = eval(amount)
+        if re.match(r"\(\d+\)", amount):
+            amount = -1 * amount_num
+        else:
+            amount = amount_num
+    except SyntaxError:
+        amount = 0
+
+    return int(amount * multiplier)
+
+
+def random_cell(rng: random.Random) -> str:
+    # float 로 계산하는 기존 방식이 정확한 범위 (2 ** 53 미만)
+    number = f"{rng.randint(0, 10 ** rng.randint(1, 12)):,}"
+    return rng.choice(
+        [
+            number,
+            f"({number})",
+            f"-{number}",
+            f" {number} ",
+            "-",
+            "",
+        ]
+    )
+
+
+def random_signed_cell(rng: random.Random):
+    """
+    기존 방식에서 처리하지 못하던 음수 부호
+    :return: (셀, 기대값)
+    """
+    number = rng.randint(0, 10 ** rng.randint(1, 12))
+    sign = rng.choice(NEGATIVE_SIGNS)
+    return rng.choice([f"{sign}{number:,}", f" {sign} {number:,} "]), -number
+
+
+def compare(cells, multiplier: int, divisor: int):
+    cells = [cell for cell in cells if LEGACY_CELL_PATTERN.match(cell.strip())]
+
+    started = time.perf_counter()
+    expected = [parse_legacy(cell, multiplier / divisor) for cell in cells]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parsed = scale_amounts(
+        parse_amount_cells(cells, multiplier=multiplier), divisor
+    ).tolist()
+    elapsed = time.perf_counter() - started
+
+    mismatches = [(cell, a, b) for cell, a, b in zip(cells, expected, parsed) if a != b]
+    return len(cells), legacy_elapsed, elapsed, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", help="저장한 viewer.do 페이지")
+    parser.add_argument("--cells", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sources = [("random", [random_cell(rng) for _ in range(args.cells)])]
+    for path in args.paths:
+        with open(path, encoding="utf-8") as f:
+            document = ViewerDocument(f.read())
+        sources.append((path, [td.text for td in document.soup.find_all("td")]))
+
+    print(f"{'source':<30}{'multiplier':>12}{'cells':>10}{'eval':>10}{'parser':>10}")
+    failed = False
+    for name, cells in sources:
+        for multiplier, divisor in [(1, 1), (1000, 1), (1, 1000)]:
+            count, legacy_elapsed, elapsed, mismatches = compare(
+                cells, multiplier, divisor
+            )
+            print(
+                f"{name[-30:]:<30}{f'{multiplier}/{divisor}':>12}{count:>10}{legacy_elapsed:>10.3f}{elapsed:>10.3f}"
+            )
+            for cell, expected, parsed in mismatches[:5]:
+                failed = True
+                print(f"\tmismatch {cell!r}: eval={expected} parser={parsed}")
+
+    # 기존 방식에서 처리하지 못하던 형식
+    cases = {
+        "−1,234": -1234,
+        "－1,234": -1234,
+        "–1,234": -1234,
+        "△1,234": -1234,
+        "▲1,234": -1234,
+        "－": 0,
+        "1,234(*1)": 1234,
+        "(1,234) *2": -1234,
+        "1,234(주3)": 1234,
+        "(1.5)": -1,
+        "N/A": 0,
+        # 짝이 맞지 않는 괄호는 읽지 않음 (경고)
+        "(1,234": 0,
+        "1,234)": 0,
+    }
+    cases.update(random_signed_cell(rng) for _ in range(1000))
+    parsed = parse_amount_cells(list(cases)).tolist()
+    for (cell, expected), value in zip(cases.items(), parsed):
+        if expected != value:
+            failed = True
+            print(f"\tmismatch {cell!r}: expected={expected} parser={value}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+저장해둔 공시뷰어(viewer.do) 페이지로 HTML 파서별 파싱 시간과 추출 결과 비교
+항상 NESTED_CONTAINER_PAGE 를 함께 비교. parse_only 가 True 인 행이 모두 identical=True 인 경우에만
+DART_HTML_PARSE_ONLY=1 사용
+
+python scripts/bench_html_parsers.py footnote.html executives.html --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DETAIL_DATA_SECTIONS  # noqa: E402
+from config import HTML_STRAINER_TAGS  # noqa: E402
+from config import HtmlParsers  # noqa: E402
+from documents import ViewerDocument  # noqa: E402
+
+BACKENDS = [
+    (HtmlParsers.HTML_PARSER.value, None),
+    (HtmlParsers.HTML_PARSER.value, HTML_STRAINER_TAGS),
+    (HtmlParsers.LXML.value, None),
+    (HtmlParsers.LXML.value, HTML_STRAINER_TAGS),
+]
+
+# 섹션 제목과 표가 서로 다른 div 안에 있는 경우. 전체를 파싱하면 제목 다음에 표가 없지만
+# p, table 만 파싱하면 div 가 사라져서 관계없는 표를 찾음
+NESTED_CONTAINER_PAGE = """
+<html><body>
+<div><p>25. 비용의 성격별 분류</p></div>
+<div>
+<table><tr><td>(단위 : 백만원)</td></tr></table>
+<table><tbody><tr><td>종업원급여</td><td>1,234</td></tr></tbody></table>
+</div>
+</body></html>
+"""
+
+
+def extract(document: ViewerDocument):
+    """
+    Report 에서 사용하는 섹션, 표의 텍스트
+    """
+    result = []
+    for title, _ in DETAIL_DATA_SECTIONS.values():
+        tables = document.get_section_tables(title)
+        result.append(tuple(table.text if table else None for table in tables))
+
+    header = document.find_paragraph(r"(.+)\. 미등기임원", exclude="보수")
+    if header:
+        tables = list(document.iter_next_tables(header, skip_empty=False))
+        result.append(tables[1].text if len(tables) > 1 else None)
+    else:
+        result.append(None)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", help="저장한 viewer.do 페이지")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = [("nested-container", NESTED_CONTAINER_PAGE)]
+    for path in args.paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append((path, f.read()))
+
+    print(f"{'parser':<14}{'parse_only':<12}{'seconds':>10}  identical")
+    baseline = None
+    for parser_name, parse_only in BACKENDS:
+        try:
+            results = [
+                extract(ViewerDocument(html, parser_name, parse_only))
+                for _, html in pages
+            ]
+        except Exception as e:
+            print(f"{parser_name:<14}{str(bool(parse_only)):<12}{'-':>10}  {e}")
+            continue
+
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for _, html in pages:
+                extract(ViewerDocument(html, parser_name, parse_only))
+        elapsed = (time.perf_counter() - started) / args.repeat
+
+        if baseline is None:
+            baseline = results
+
+        print(
+            f"{parser_name:<14}{str(bool(parse_only)):<12}{elapsed:>10.3f}  {results == baseline}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -31,3 +31,27 @@ def remove_escape_characters(input_string: str) -> str:
         input_string = input_string.replace(char, "")
 
     return input_string
+
+
+class lazy_property:
+    """
+    처음 접근할 때 한 번만 계산해서 인스턴스에 저장하는 property.
+    functools.cached_property (python < 3.12) 와 달리 클래스 단위 lock 을 잡지 않아서
+    여러 쓰레드에서 서로 다른 인스턴스의 값을 동시에 불러올 수 있음
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
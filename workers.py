@@ -0,0 +1,117 @@
+import asyncio
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+
+from config import EXECUTION_MODE
+from config import FETCH_MAX_IN_FLIGHT
+from config import FETCH_MAX_WORKERS
+from config import ExecutionModes
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    mode: ExecutionModes = ExecutionModes(EXECUTION_MODE),
+    max_workers: int = FETCH_MAX_WORKERS,
+    max_in_flight: int = FETCH_MAX_IN_FLIGHT,
+) -> Iterator[R]:
+    """
+    items 의 각 항목에 func 를 적용. 실행 방식과 관계없이 결과는 items 순서대로 반환
+    :param mode: SEQUENTIAL -> 순서대로 하나씩 실행, THREADS -> 쓰레드 풀에서 동시에 실행
+    :param max_workers: 동시에 실행하는 쓰레드 수
+    :param max_in_flight: 제출했지만 결과를 가져가지 않은 최대 작업 수
+        items 가 많아도 결과가 한꺼번에 쌓이지 않도록 제한
+    """
+    if mode == ExecutionModes.SEQUENTIAL or max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    max_in_flight = max(max_in_flight, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from iter_results(executor, func, items, max_in_flight)
+
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    HTML 파싱, 표 추출 등 CPU 작업용 process pool
+    보고서를 불러오는 쓰레드가 실행 중일 때 생성되므로, 다른 쓰레드가 잡고 있던 lock 이
+    그대로 복사될 수 있는 fork 대신 spawn 사용
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def map_processes(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    max_in_flight: int = FETCH_MAX_IN_FLIGHT,
+) -> Iterator[R]:
+    """
+    map_bounded 의 process pool 버전. func, items, 결과는 pickle 할 수 있어야 함
+    items 는 필요할 때 하나씩 가져가므로, 다른 단계(ex. map_bounded)의 결과를 바로 연결할 수 있음
+    """
+    max_in_flight = max(max_in_flight, max_workers)
+    with get_process_pool(max_workers) as executor:
+        yield from iter_results(executor, func, items, max_in_flight)
+
+
+def iter_results(
+    executor: Executor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterator[R]:
+    """
+    결과를 가져가지 않은 작업이 max_in_flight 이하가 되도록 제출하면서 items 순서대로 결과 반환
+    """
+    futures = deque()
+    try:
+        for item in items:
+            if len(futures) >= max_in_flight:
+                yield futures.popleft().result()
+            futures.append(executor.submit(func, item))
+
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        # 도중에 오류가 난 경우 아직 시작하지 않은 작업은 취소
+        for future in futures:
+            future.cancel()
+
+
+async def amap_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_in_flight: int = FETCH_MAX_IN_FLIGHT,
+) -> AsyncIterator[R]:
+    """
+    map_bounded 의 asyncio 버전. 결과는 items 순서대로 반환
+    :param max_in_flight: 동시에 실행 중이거나 결과를 가져가지 않은 최대 작업 수
+    """
+    tasks = deque()
+    try:
+        for item in items:
+            if len(tasks) >= max_in_flight:
+                yield await tasks.popleft()
+            tasks.append(asyncio.ensure_future(func(item)))
+
+        while tasks:
+            yield await tasks.popleft()
+    finally:
+        for task in tasks:
+            task.cancel()